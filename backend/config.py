@@ -0,0 +1,53 @@
+from functools import lru_cache
+from typing import Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Application settings read from the environment and the optional .env file.
+
+    Field names map to upper-case environment variables, e.g. ``db_pool_size``
+    is read from ``DB_POOL_SIZE``.
+    """
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # Database
+    database_url: Optional[str] = None
+    environment: str = "development"
+    db_pool_size: int = 20
+    db_max_overflow: int = 30
+    db_pool_timeout: int = 10
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = False
+    run_migrations: bool = False
+    # PostgreSQL server-side timeouts in milliseconds (0 disables)
+    db_statement_timeout_ms: int = 5000
+    db_idle_in_transaction_timeout_ms: int = 10000
+    db_lock_timeout_ms: int = 3000
+    # asyncpg prepared statements cached per connection (0 disables)
+    db_prepared_statement_cache_size: int = 500
+    # Set when connecting through PgBouncer in transaction pooling mode
+    db_pgbouncer: bool = False
+
+    # Logging
+    log_level: str = "INFO"
+
+    # AI service
+    gemini_api_key: Optional[str] = None
+    gemini_temperature: float = 0.7  # Sampling temperature for every attempt
+    generation_cache_ttl: int = 86400  # Seconds a generation result is reused
+    concurrent_request_per_worker: int = 4  # Generations run at once per worker
+
+    # Cache
+    redis_url: Optional[str] = None
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Get application settings, parsing the environment and .env only once.
+
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
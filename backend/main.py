@@ -1,28 +1,34 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-import os
-from dotenv import load_dotenv
+from alembic import command
+from alembic.config import Config
+from pathlib import Path
 import logging
 
+from config import get_settings
 from database import get_db, engine
-from models import Base
 from routes import questions, stats
-from services.gemini_service import GeminiService
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging once for the whole application
+logging.basicConfig(
+    level=get_settings().log_level.upper(),
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
+# Built once so every health check reuses the same statement and hits the
+# engine's compiled-statement cache
+_HEALTH_STMT = text("SELECT 1")
 
 # Create FastAPI app first (faster than table creation)
 app = FastAPI(
     title="Interview Prep Platform",
     description="AI-powered interview question generation and management platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson serializes much faster than json.dumps
 )
 
 # CORS middleware
@@ -32,37 +38,56 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Has-More"],  # Pagination headers for list endpoints
 )
 
-# Lazy initialization flags
+# Lazy initialization flag
 _db_initialized = False
-_gemini_service = None
 
-def ensure_db_initialized():
-    """Initialize database tables on first use (lazy initialization)"""
+_ALEMBIC_DIR = Path(__file__).resolve().parent
+# Arbitrary key for the PostgreSQL advisory lock that serializes migrations
+_MIGRATION_LOCK_ID = 4242
+
+
+def _upgrade_schema(connection) -> None:
+    """Apply pending Alembic migrations on a synchronous connection handle.
+    
+    On PostgreSQL a transaction-level advisory lock makes workers starting
+    together wait for each other; the later ones then find the schema at
+    head and do nothing.
+    
+    Args:
+        connection: Connection the migrations run on, inside a transaction
+    """
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": _MIGRATION_LOCK_ID})
+    cfg = Config(str(_ALEMBIC_DIR / "alembic.ini"))
+    cfg.set_main_option("script_location", str(_ALEMBIC_DIR / "migrations"))
+    cfg.attributes["connection"] = connection
+    command.upgrade(cfg, "head")
+
+
+async def ensure_db_initialized():
+    """Bring the database schema up to date on first use (lazy initialization)
+    
+    Migrations only run when RUN_MIGRATIONS=1; otherwise the schema is
+    managed with Alembic (``alembic upgrade head``) and workers skip the
+    catalog round-trips on every boot.
+    """
     global _db_initialized
     if not _db_initialized:
-        try:
-            logger.info("Creating database tables...")
-            Base.metadata.create_all(bind=engine)
+        if not get_settings().run_migrations:
             _db_initialized = True
-            logger.info("Database tables created successfully")
-        except Exception as e:
-            logger.error(f"Failed to create database tables: {e}")
-            raise
-
-def get_gemini_service():
-    """Get or initialize Gemini service lazily"""
-    global _gemini_service
-    if _gemini_service is None:
+            return
         try:
-            logger.info("Initializing Gemini service...")
-            _gemini_service = GeminiService()
-            logger.info("Gemini service initialized successfully")
+            logger.info("Applying database migrations...")
+            async with engine.begin() as conn:
+                await conn.run_sync(_upgrade_schema)
+            _db_initialized = True
+            logger.info("Database schema is up to date")
         except Exception as e:
-            logger.error(f"Failed to initialize Gemini service: {e}")
+            logger.error(f"Failed to apply database migrations: {e}")
             raise
-    return _gemini_service
 
 # Include routers
 app.include_router(questions.router, prefix="/api/questions", tags=["questions"])
@@ -72,21 +97,25 @@ app.include_router(stats.router, prefix="/api/stats", tags=["stats"])
 async def startup_event():
     """Initialize critical resources after app starts"""
     try:
-        ensure_db_initialized()
+        await ensure_db_initialized()
         logger.info("Startup event completed successfully")
     except Exception as e:
         logger.error(f"Startup error: {e}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled database connections so the process can exit cleanly"""
+    await engine.dispose()
+
 @app.get("/")
 async def root():
     return {"message": "Interview Prep Platform API", "version": "1.0.0"}
 
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_db)):
     """Fast health check without heavy operations"""
     try:
-        # Use text() for explicit SQL
-        db.execute(text("SELECT 1"))
+        await db.execute(_HEALTH_STMT)
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         logger.error(f"Health check failed: {e}")
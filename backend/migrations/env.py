@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from database import DATABASE_URL, _to_async_url
+from models import Base
+
+config = context.config
+
+# An application running the migrations passes its own connection and has
+# already configured logging
+connection = config.attributes.get("connection")
+
+if config.config_file_name is not None and connection is None:
+    fileConfig(config.config_file_name)
+
+logger = logging.getLogger("alembic.env")
+
+target_metadata = Base.metadata
+
+
+def _include_object_for(dialect_name: str):
+    """Build an autogenerate filter that skips objects restricted to other dialects.
+    
+    Autogenerate does not honour ``.ddl_if(dialect=...)``, so without this a
+    PostgreSQL-only index would always show up as missing on SQLite.
+    """
+    def include_object(obj, name, type_, reflected, compare_to):
+        ddl_if = getattr(obj, "_ddl_if", None)
+        if ddl_if is not None and ddl_if.dialect:
+            dialects = (ddl_if.dialect,) if isinstance(ddl_if.dialect, str) else ddl_if.dialect
+            return dialect_name in dialects
+        return True
+    return include_object
+
+
+def run_migrations_offline() -> None:
+    """Emit migration SQL without connecting to the database"""
+    url = _to_async_url(DATABASE_URL)
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        include_object=_include_object_for(make_url(url).get_dialect().name),
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run_migrations(connection) -> None:
+    """Run migrations on a synchronous connection handle"""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=_include_object_for(connection.dialect.name),
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    """Run migrations against the configured database"""
+    # Dedicated engine without pooling: migrations run once and exit
+    connectable = create_async_engine(_to_async_url(DATABASE_URL), poolclass=NullPool)
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(_run_migrations)
+
+    await connectable.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+elif connection is not None:
+    _run_migrations(connection)
+else:
+    asyncio.run(run_migrations_online())
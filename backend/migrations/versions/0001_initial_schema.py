@@ -0,0 +1,88 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('question_sets',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=False, comment='Name of the question set (1-200 chars)'),
+    sa.Column('description', sa.Text(), nullable=True, comment='Description of the question set (max 1000 chars)'),
+    sa.Column('job_title', sa.String(length=100), nullable=False, comment='Job title for the question set (2-100 chars)'),
+    sa.Column('question_ids', sa.Text(), nullable=False, comment='JSON string of question IDs'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False, comment='Creation timestamp'),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True, comment='Last update timestamp'),
+    sa.CheckConstraint('LENGTH(job_title) >= 2 AND LENGTH(job_title) <= 100', name='check_set_job_title_length'),
+    sa.CheckConstraint('LENGTH(name) >= 1 AND LENGTH(name) <= 200', name='check_set_name_length'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_set_created_at', 'question_sets', ['created_at'], unique=False)
+    op.create_index('idx_set_job_title', 'question_sets', ['job_title'], unique=False)
+    op.create_index(op.f('ix_question_sets_id'), 'question_sets', ['id'], unique=False)
+    op.create_index(op.f('ix_question_sets_job_title'), 'question_sets', ['job_title'], unique=False)
+    op.create_table('questions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('job_title', sa.String(length=100), nullable=False, comment='Job title for the question (2-100 chars)'),
+    sa.Column('question_text', sa.Text(), nullable=False, comment='The interview question text (10-2000 chars)'),
+    sa.Column('question_type', sa.String(length=50), nullable=False, comment="Type: 'technical', 'behavioral', or 'mixed'"),
+    sa.Column('difficulty', sa.Integer(), nullable=False, comment='Difficulty level 1-5'),
+    sa.Column('is_flagged', sa.Boolean(), nullable=False, comment='Whether question is flagged'),
+    sa.Column('tags', sa.String(length=500), nullable=True, comment='Comma-separated tags'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False, comment='Creation timestamp'),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True, comment='Last update timestamp'),
+    sa.CheckConstraint("question_type IN ('technical', 'behavioral', 'mixed')", name='check_question_type'),
+    sa.CheckConstraint('LENGTH(job_title) >= 2 AND LENGTH(job_title) <= 100', name='check_job_title_length'),
+    sa.CheckConstraint('LENGTH(question_text) >= 10 AND LENGTH(question_text) <= 2000', name='check_question_text_length'),
+    sa.CheckConstraint('difficulty >= 1 AND difficulty <= 5', name='check_difficulty_range'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_created_at', 'questions', ['created_at'], unique=False)
+    op.create_index('idx_is_flagged', 'questions', ['is_flagged'], unique=False)
+    op.create_index('idx_job_title_type', 'questions', ['job_title', 'question_type'], unique=False)
+    op.create_index(op.f('ix_questions_id'), 'questions', ['id'], unique=False)
+    op.create_index(op.f('ix_questions_job_title'), 'questions', ['job_title'], unique=False)
+    op.create_table('user_ratings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('question_id', sa.Integer(), nullable=False, comment='ID of the rated question'),
+    sa.Column('rating', sa.Float(), nullable=False, comment='Rating value between 1.0 and 5.0'),
+    sa.Column('feedback', sa.Text(), nullable=True, comment='Optional user feedback (max 1000 chars)'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False, comment='Creation timestamp'),
+    sa.CheckConstraint('question_id > 0', name='check_question_id_positive'),
+    sa.CheckConstraint('rating >= 1.0 AND rating <= 5.0', name='check_rating_range'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_rating_created_at', 'user_ratings', ['created_at'], unique=False)
+    op.create_index('idx_rating_question_id', 'user_ratings', ['question_id'], unique=False)
+    op.create_index(op.f('ix_user_ratings_id'), 'user_ratings', ['id'], unique=False)
+    op.create_index(op.f('ix_user_ratings_question_id'), 'user_ratings', ['question_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_user_ratings_question_id'), table_name='user_ratings')
+    op.drop_index(op.f('ix_user_ratings_id'), table_name='user_ratings')
+    op.drop_index('idx_rating_question_id', table_name='user_ratings')
+    op.drop_index('idx_rating_created_at', table_name='user_ratings')
+    op.drop_table('user_ratings')
+    op.drop_index(op.f('ix_questions_job_title'), table_name='questions')
+    op.drop_index(op.f('ix_questions_id'), table_name='questions')
+    op.drop_index('idx_job_title_type', table_name='questions')
+    op.drop_index('idx_is_flagged', table_name='questions')
+    op.drop_index('idx_created_at', table_name='questions')
+    op.drop_table('questions')
+    op.drop_index(op.f('ix_question_sets_job_title'), table_name='question_sets')
+    op.drop_index(op.f('ix_question_sets_id'), table_name='question_sets')
+    op.drop_index('idx_set_job_title', table_name='question_sets')
+    op.drop_index('idx_set_created_at', table_name='question_sets')
+    op.drop_table('question_sets')
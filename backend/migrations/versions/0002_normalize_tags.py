@@ -0,0 +1,56 @@
+"""normalize tags
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    tags = op.create_table('tags',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=500), nullable=False, comment='Lowercase tag name'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    question_tags = op.create_table('question_tags',
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['question_id'], ['questions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('question_id', 'tag_id')
+    )
+    op.create_index('idx_question_tags_tag_id', 'question_tags', ['tag_id', 'question_id'], unique=False)
+
+    # Backfill the association from the existing comma-separated column
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, tags FROM questions WHERE tags IS NOT NULL")).all()
+    tags_by_question = {
+        q_id: {t.strip().lower() for t in csv.split(',') if t.strip()}
+        for q_id, csv in rows
+    }
+    names = sorted(set().union(*tags_by_question.values()))
+    if not names:
+        return
+    op.bulk_insert(tags, [{'name': name} for name in names])
+    tag_ids = dict(conn.execute(sa.select(tags.c.name, tags.c.id)).all())
+    op.bulk_insert(question_tags, [
+        {'question_id': q_id, 'tag_id': tag_ids[name]}
+        for q_id, q_names in tags_by_question.items()
+        for name in q_names
+    ])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_question_tags_tag_id', table_name='question_tags')
+    op.drop_table('question_tags')
+    op.drop_table('tags')
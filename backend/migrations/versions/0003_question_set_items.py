@@ -0,0 +1,65 @@
+"""question set items
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    items = op.create_table('question_set_items',
+    sa.Column('set_id', sa.Integer(), nullable=False),
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False, comment='Order of the question within the set'),
+    sa.ForeignKeyConstraint(['question_id'], ['questions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['set_id'], ['question_sets.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('set_id', 'question_id')
+    )
+    op.create_index('idx_set_items_question_id', 'question_set_items', ['question_id'], unique=False)
+
+    # Backfill from the JSON column, skipping IDs of questions that no longer exist
+    conn = op.get_bind()
+    existing = {row[0] for row in conn.execute(sa.text("SELECT id FROM questions"))}
+    rows = []
+    for set_id, question_ids in conn.execute(sa.text("SELECT id, question_ids FROM question_sets")):
+        seen = set()
+        for q_id in json.loads(question_ids or '[]'):
+            if q_id in existing and q_id not in seen:
+                seen.add(q_id)
+                rows.append({'set_id': set_id, 'question_id': q_id, 'position': len(seen) - 1})
+    if rows:
+        op.bulk_insert(items, rows)
+
+    with op.batch_alter_table('question_sets') as batch_op:
+        batch_op.drop_column('question_ids')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('question_sets') as batch_op:
+        batch_op.add_column(sa.Column('question_ids', sa.Text(), nullable=False, server_default='[]', comment='JSON string of question IDs'))
+
+    conn = op.get_bind()
+    question_ids = {}
+    for set_id, q_id in conn.execute(sa.text(
+        "SELECT set_id, question_id FROM question_set_items ORDER BY set_id, position"
+    )):
+        question_ids.setdefault(set_id, []).append(q_id)
+    for set_id, ids in question_ids.items():
+        conn.execute(
+            sa.text("UPDATE question_sets SET question_ids = :ids WHERE id = :id"),
+            {'ids': json.dumps(ids), 'id': set_id}
+        )
+
+    op.drop_index('idx_set_items_question_id', table_name='question_set_items')
+    op.drop_table('question_set_items')
@@ -0,0 +1,31 @@
+"""rating question foreign key
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Ratings of deleted questions would violate the new constraint
+    op.execute("DELETE FROM user_ratings WHERE question_id NOT IN (SELECT id FROM questions)")
+    with op.batch_alter_table('user_ratings') as batch_op:
+        batch_op.create_foreign_key(
+            'fk_user_ratings_question_id', 'questions', ['question_id'], ['id'], ondelete='CASCADE'
+        )
+        batch_op.create_index('idx_rating_qid_rating', ['question_id', 'rating'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('user_ratings') as batch_op:
+        batch_op.drop_index('idx_rating_qid_rating')
+        batch_op.drop_constraint('fk_user_ratings_question_id', type_='foreignkey')
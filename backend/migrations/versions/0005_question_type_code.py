@@ -0,0 +1,52 @@
+"""question type code
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('questions') as batch_op:
+        batch_op.drop_constraint('check_question_type', type_='check')
+    op.execute(
+        "UPDATE questions SET question_type = CASE question_type "
+        "WHEN 'technical' THEN '1' WHEN 'behavioral' THEN '2' ELSE '3' END"
+    )
+    with op.batch_alter_table('questions') as batch_op:
+        batch_op.alter_column('question_type',
+               existing_type=sa.String(length=50),
+               type_=sa.SmallInteger(),
+               comment='Type code: 1=technical, 2=behavioral, 3=mixed',
+               existing_comment="Type: 'technical', 'behavioral', or 'mixed'",
+               existing_nullable=False,
+               postgresql_using='question_type::smallint')
+        batch_op.create_check_constraint('check_question_type', 'question_type IN (1, 2, 3)')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('questions') as batch_op:
+        batch_op.drop_constraint('check_question_type', type_='check')
+        batch_op.alter_column('question_type',
+               existing_type=sa.SmallInteger(),
+               type_=sa.String(length=50),
+               comment="Type: 'technical', 'behavioral', or 'mixed'",
+               existing_comment='Type code: 1=technical, 2=behavioral, 3=mixed',
+               existing_nullable=False)
+    op.execute(
+        "UPDATE questions SET question_type = CASE question_type "
+        "WHEN '1' THEN 'technical' WHEN '2' THEN 'behavioral' ELSE 'mixed' END"
+    )
+    with op.batch_alter_table('questions') as batch_op:
+        batch_op.create_check_constraint(
+            'check_question_type', "question_type IN ('technical', 'behavioral', 'mixed')"
+        )
@@ -0,0 +1,37 @@
+"""drop redundant indexes
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Duplicates of primary keys, of idx_set_job_title, or leading-column
+    # prefixes of idx_job_title_type / idx_rating_qid_rating
+    op.drop_index(op.f('ix_questions_id'), table_name='questions')
+    op.drop_index(op.f('ix_questions_job_title'), table_name='questions')
+    op.drop_index(op.f('ix_question_sets_id'), table_name='question_sets')
+    op.drop_index(op.f('ix_question_sets_job_title'), table_name='question_sets')
+    op.drop_index(op.f('ix_user_ratings_id'), table_name='user_ratings')
+    op.drop_index(op.f('ix_user_ratings_question_id'), table_name='user_ratings')
+    op.drop_index('idx_rating_question_id', table_name='user_ratings')
+
+
+def downgrade() -> None:
+    op.create_index('idx_rating_question_id', 'user_ratings', ['question_id'], unique=False)
+    op.create_index(op.f('ix_user_ratings_question_id'), 'user_ratings', ['question_id'], unique=False)
+    op.create_index(op.f('ix_user_ratings_id'), 'user_ratings', ['id'], unique=False)
+    op.create_index(op.f('ix_question_sets_job_title'), 'question_sets', ['job_title'], unique=False)
+    op.create_index(op.f('ix_question_sets_id'), 'question_sets', ['id'], unique=False)
+    op.create_index(op.f('ix_questions_job_title'), 'questions', ['job_title'], unique=False)
+    op.create_index(op.f('ix_questions_id'), 'questions', ['id'], unique=False)
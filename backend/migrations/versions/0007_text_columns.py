@@ -0,0 +1,60 @@
+"""text columns
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+# (table, column, previous length, indexed); lengths are enforced by CHECK
+# constraints. MySQL can't index TEXT without a prefix length, so indexed
+# columns stay VARCHAR there
+_COLUMNS = [
+    ('questions', 'job_title', 100, True),
+    ('questions', 'tags', 500, False),
+    ('question_sets', 'name', 200, False),
+    ('question_sets', 'job_title', 100, True),
+    ('tags', 'name', 500, True),
+]
+
+
+def _text_type(length: int, indexed: bool):
+    if indexed:
+        return sa.Text().with_variant(sa.String(length=length), 'mysql')
+    return sa.Text()
+
+
+def upgrade() -> None:
+    for table, column, length, indexed in _COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=length),
+                type_=_text_type(length, indexed)
+            )
+    with op.batch_alter_table('questions') as batch_op:
+        batch_op.create_check_constraint('check_tags_length', 'LENGTH(tags) <= 500')
+    with op.batch_alter_table('tags') as batch_op:
+        batch_op.create_check_constraint('check_tag_name_length', 'LENGTH(name) <= 500')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tags') as batch_op:
+        batch_op.drop_constraint('check_tag_name_length', type_='check')
+    with op.batch_alter_table('questions') as batch_op:
+        batch_op.drop_constraint('check_tags_length', type_='check')
+    for table, column, length, indexed in _COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=_text_type(length, indexed),
+                type_=sa.String(length=length)
+            )
@@ -0,0 +1,31 @@
+"""question list indexes
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_questions_type_flag_id', 'questions', ['question_type', 'is_flagged', 'id'], unique=False)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            'idx_questions_job_title_trgm', 'questions', ['job_title'], unique=False,
+            postgresql_using='gin', postgresql_ops={'job_title': 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('idx_questions_job_title_trgm', table_name='questions')
+    op.drop_index('idx_questions_type_flag_id', table_name='questions')
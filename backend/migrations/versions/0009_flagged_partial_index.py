@@ -0,0 +1,32 @@
+"""flagged partial index
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_is_flagged', table_name='questions')
+    # Partial indexes are not supported on MySQL
+    if op.get_bind().dialect.name in ('postgresql', 'sqlite'):
+        op.create_index(
+            'idx_questions_flagged_id', 'questions', ['id'], unique=False,
+            postgresql_where=sa.text('is_flagged'),
+            sqlite_where=sa.text('is_flagged = 1'),
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name in ('postgresql', 'sqlite'):
+        op.drop_index('idx_questions_flagged_id', table_name='questions')
+    op.create_index('idx_is_flagged', 'questions', ['is_flagged'], unique=False)
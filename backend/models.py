@@ -1,18 +1,111 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Float, CheckConstraint, Index
-from sqlalchemy.sql import func
-from sqlalchemy.orm import validates
+from sqlalchemy import Column, Integer, SmallInteger, DateTime, Boolean, String, Text, Float, CheckConstraint, Index, ForeignKey, Table, DDL, event
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func, text
+from sqlalchemy.types import TypeDecorator
 from database import Base
+from enum import IntEnum
+from typing import List
+
+
+class QuestionType(IntEnum):
+    """Storage codes for question types"""
+    TECHNICAL = 1
+    BEHAVIORAL = 2
+    MIXED = 3
+
+
+def _indexed_text(length: int):
+    """Text type for an indexed column; stays VARCHAR(length) on MySQL.
+    
+    MySQL can't index a TEXT column without a prefix length, so indexed
+    columns keep their bounded type there. Lengths are enforced by CHECK
+    constraints on every backend.
+    """
+    return Text().with_variant(String(length), "mysql")
+
+
+class QuestionTypeCode(TypeDecorator):
+    """Stores a question type name as its SmallInteger code.
+    
+    The ORM and API keep working with the lowercase names
+    ('technical', 'behavioral', 'mixed'); only the column is an integer.
+    """
+    impl = SmallInteger
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return QuestionType[value.upper()].value
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return QuestionType(value).name.lower()
+
+
+# Many-to-many link between questions and normalized tags; the composite
+# primary key serves question -> tags lookups and idx_question_tags_tag_id
+# serves tag -> questions filtering
+question_tags = Table(
+    "question_tags",
+    Base.metadata,
+    Column("question_id", Integer, ForeignKey("questions.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Index("idx_question_tags_tag_id", "tag_id", "question_id"),
+)
+
+
+class QuestionSetItem(Base):
+    """SQLAlchemy model for the ordered membership of a question in a set"""
+    __tablename__ = "question_set_items"
+    
+    set_id = Column(Integer, ForeignKey("question_sets.id", ondelete="CASCADE"), primary_key=True)
+    question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"), primary_key=True)
+    position = Column(
+        Integer,
+        nullable=False,
+        comment="Order of the question within the set"
+    )
+    
+    # The primary key serves set -> questions loads; this index serves
+    # "which sets contain question N" lookups
+    __table_args__ = (
+        Index("idx_set_items_question_id", "question_id"),
+    )
+    
+    def __repr__(self):
+        return f"<QuestionSetItem(set_id={self.set_id}, question_id={self.question_id}, position={self.position})>"
+
+
+class Tag(Base):
+    """SQLAlchemy model for a normalized, lowercase question tag"""
+    __tablename__ = "tags"
+    
+    id = Column(Integer, primary_key=True)
+    name = Column(
+        _indexed_text(500),
+        nullable=False,
+        unique=True,
+        comment="Lowercase tag name"
+    )
+    
+    __table_args__ = (
+        CheckConstraint('LENGTH(name) <= 500', name='check_tag_name_length'),
+    )
+    
+    def __repr__(self):
+        return f"<Tag(id={self.id}, name='{self.name}')>"
 
 
 class Question(Base):
     """SQLAlchemy model for interview questions with validation constraints"""
     __tablename__ = "questions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     job_title = Column(
-        String(100),
+        _indexed_text(100),
         nullable=False,
-        index=True,
         comment="Job title for the question (2-100 chars)"
     )
     question_text = Column(
@@ -21,9 +114,9 @@ class Question(Base):
         comment="The interview question text (10-2000 chars)"
     )
     question_type = Column(
-        String(50),
+        QuestionTypeCode,
         nullable=False,
-        comment="Type: 'technical', 'behavioral', or 'mixed'"
+        comment="Type code: 1=technical, 2=behavioral, 3=mixed"
     )
     difficulty = Column(
         Integer,
@@ -38,7 +131,7 @@ class Question(Base):
         comment="Whether question is flagged"
     )
     tags = Column(
-        String(500),
+        Text,
         nullable=True,
         comment="Comma-separated tags"
     )
@@ -59,100 +152,51 @@ class Question(Base):
     __table_args__ = (
         CheckConstraint('LENGTH(job_title) >= 2 AND LENGTH(job_title) <= 100', name='check_job_title_length'),
         CheckConstraint('LENGTH(question_text) >= 10 AND LENGTH(question_text) <= 2000', name='check_question_text_length'),
-        CheckConstraint("question_type IN ('technical', 'behavioral', 'mixed')", name='check_question_type'),
+        CheckConstraint('question_type IN (1, 2, 3)', name='check_question_type'),
         CheckConstraint('difficulty >= 1 AND difficulty <= 5', name='check_difficulty_range'),
+        CheckConstraint('LENGTH(tags) <= 500', name='check_tags_length'),
+        # Also serves job_title-only lookups through its leading column
         Index('idx_job_title_type', 'job_title', 'question_type'),
-        Index('idx_is_flagged', 'is_flagged'),
         Index('idx_created_at', 'created_at'),
+        # Serves type/flag filtered listings in id order; through its leading
+        # column it also serves GROUP BY question_type
+        Index('idx_questions_type_flag_id', 'question_type', 'is_flagged', 'id'),
+        # Partial index over the few flagged rows, in id order, for the
+        # flagged-only listing; MySQL has no partial indexes
+        Index(
+            'idx_questions_flagged_id', 'id',
+            postgresql_where=text('is_flagged'),
+            sqlite_where=text('is_flagged = 1'),
+        ).ddl_if(dialect=('postgresql', 'sqlite')),
+        # Trigram index so ILIKE '%...%' job title searches avoid a full scan
+        Index(
+            'idx_questions_job_title_trgm', 'job_title',
+            postgresql_using='gin',
+            postgresql_ops={'job_title': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
     )
     
-    @validates('job_title')
-    def validate_job_title(self, key, value):
-        """Validate job title before setting"""
-        if not value or not str(value).strip():
-            raise ValueError("job_title cannot be empty")
-        
-        value = str(value).strip()
-        if len(value) < 2:
-            raise ValueError("job_title must be at least 2 characters")
-        if len(value) > 100:
-            raise ValueError("job_title must not exceed 100 characters")
-        
-        # Check for invalid characters
-        if not all(c.isalnum() or c.isspace() or c in ['-', '+', '.', '#'] for c in value):
-            raise ValueError("job_title contains invalid characters")
-        
-        return value
-    
-    @validates('question_text')
-    def validate_question_text(self, key, value):
-        """Validate question text before setting"""
-        if not value or not str(value).strip():
-            raise ValueError("question_text cannot be empty")
-        
-        value = str(value).strip()
-        if len(value) < 10:
-            raise ValueError("question_text must be at least 10 characters")
-        if len(value) > 2000:
-            raise ValueError("question_text must not exceed 2000 characters")
-        
-        return value
-    
-    @validates('question_type')
-    def validate_question_type(self, key, value):
-        """Validate question type before setting"""
-        valid_types = {'technical', 'behavioral', 'mixed'}
-        value = str(value).lower().strip()
-        
-        if value not in valid_types:
-            raise ValueError(f"question_type must be one of {valid_types}")
-        
-        return value
-    
-    @validates('difficulty')
-    def validate_difficulty(self, key, value):
-        """Validate difficulty level before setting"""
-        if value is None:
-            return 1
-        
-        value = int(value)
-        if value < 1 or value > 5:
-            raise ValueError("difficulty must be between 1 and 5")
-        
-        return value
-    
-    @validates('tags')
-    def validate_tags(self, key, value):
-        """Validate and clean tags before setting"""
-        if value is None:
-            return None
-        
-        value = str(value).strip()
-        if not value:
-            return None
-        
-        if len(value) > 500:
-            raise ValueError("tags must not exceed 500 characters")
-        
-        # Validate tag format
-        tags_list = [tag.strip() for tag in value.split(',')]
-        invalid_tags = [tag for tag in tags_list if not all(c.isalnum() or c in ['_', '-'] for c in tag)]
-        
-        if invalid_tags:
-            raise ValueError(f"Invalid tag format: {invalid_tags}")
-        
-        return ','.join(tags_list)
+    # Fetch server-generated created_at/updated_at via RETURNING in the same
+    # INSERT/UPDATE instead of expiring them and issuing a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self):
         return f"<Question(id={self.id}, job_title='{self.job_title}', type='{self.question_type}', difficulty={self.difficulty})>"
 
+# gin_trgm_ops needs the pg_trgm extension before the questions table is created
+event.listen(
+    Question.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
 class QuestionSet(Base):
     """SQLAlchemy model for question sets with validation constraints"""
     __tablename__ = "question_sets"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(
-        String(200),
+        Text,
         nullable=False,
         comment="Name of the question set (1-200 chars)"
     )
@@ -162,16 +206,10 @@ class QuestionSet(Base):
         comment="Description of the question set (max 1000 chars)"
     )
     job_title = Column(
-        String(100),
+        _indexed_text(100),
         nullable=False,
-        index=True,
         comment="Job title for the question set (2-100 chars)"
     )
-    question_ids = Column(
-        Text,
-        nullable=False,
-        comment="JSON string of question IDs"
-    )
     created_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -193,59 +231,32 @@ class QuestionSet(Base):
         Index('idx_set_created_at', 'created_at'),
     )
     
-    @validates('name')
-    def validate_name(self, key, value):
-        """Validate set name before setting"""
-        if not value or not str(value).strip():
-            raise ValueError("name cannot be empty")
-        
-        value = str(value).strip()
-        if len(value) > 200:
-            raise ValueError("name must not exceed 200 characters")
-        
-        return value
-    
-    @validates('description')
-    def validate_description(self, key, value):
-        """Validate set description before setting"""
-        if value is None:
-            return None
-        
-        value = str(value).strip()
-        if not value:
-            return None
-        
-        if len(value) > 1000:
-            raise ValueError("description must not exceed 1000 characters")
-        
-        return value
+    # Load created_at with the INSERT (RETURNING, or a SELECT on dialects
+    # without it) so it is never expired when the set is serialized
+    __mapper_args__ = {"eager_defaults": True}
     
-    @validates('job_title')
-    def validate_job_title(self, key, value):
-        """Validate job title before setting"""
-        if not value or not str(value).strip():
-            raise ValueError("job_title cannot be empty")
-        
-        value = str(value).strip()
-        if len(value) < 2:
-            raise ValueError("job_title must be at least 2 characters")
-        if len(value) > 100:
-            raise ValueError("job_title must not exceed 100 characters")
-        
-        return value
+    # Items are written explicitly with their position, so the relationships
+    # are read-only. Both raise on lazy access: queries must ask for them
+    # with selectinload(), which loads a whole page of sets in one extra
+    # query instead of one query per set during serialization
+    items = relationship(
+        "QuestionSetItem",
+        order_by="QuestionSetItem.position",
+        lazy="raise",
+        viewonly=True,
+    )
+    questions = relationship(
+        "Question",
+        secondary="question_set_items",
+        order_by="QuestionSetItem.position",
+        lazy="raise",
+        viewonly=True,
+    )
     
-    @validates('question_ids')
-    def validate_question_ids(self, key, value):
-        """Validate question IDs JSON before setting"""
-        if not value or not str(value).strip():
-            raise ValueError("question_ids cannot be empty")
-        
-        value = str(value).strip()
-        # Basic JSON validation (more thorough validation in schemas)
-        if not (value.startswith('[') and value.endswith(']')):
-            raise ValueError("question_ids must be valid JSON array format")
-        
-        return value
+    @property
+    def question_ids(self) -> List[int]:
+        """The set's question IDs, in set order"""
+        return [item.question_id for item in self.items]
     
     def __repr__(self):
         return f"<QuestionSet(id={self.id}, name='{self.name}', job_title='{self.job_title}')>"
@@ -254,11 +265,11 @@ class UserRating(Base):
     """SQLAlchemy model for user ratings with validation constraints"""
     __tablename__ = "user_ratings"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     question_id = Column(
         Integer,
+        ForeignKey("questions.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         comment="ID of the rated question"
     )
     rating = Column(
@@ -282,49 +293,15 @@ class UserRating(Base):
     __table_args__ = (
         CheckConstraint('question_id > 0', name='check_question_id_positive'),
         CheckConstraint('rating >= 1.0 AND rating <= 5.0', name='check_rating_range'),
-        Index('idx_rating_question_id', 'question_id'),
+        # Covers question_id lookups and per-question AVG/MIN/MAX(rating)
+        # with an index-only scan
+        Index('idx_rating_qid_rating', 'question_id', 'rating'),
         Index('idx_rating_created_at', 'created_at'),
     )
     
-    @validates('question_id')
-    def validate_question_id(self, key, value):
-        """Validate question ID before setting"""
-        if value is None:
-            raise ValueError("question_id cannot be null")
-        
-        value = int(value)
-        if value <= 0:
-            raise ValueError("question_id must be a positive integer")
-        
-        return value
-    
-    @validates('rating')
-    def validate_rating(self, key, value):
-        """Validate rating value before setting"""
-        if value is None:
-            raise ValueError("rating cannot be null")
-        
-        value = float(value)
-        if value < 1.0 or value > 5.0:
-            raise ValueError("rating must be between 1.0 and 5.0")
-        
-        # Round to 1 decimal place
-        return round(value, 1)
-    
-    @validates('feedback')
-    def validate_feedback(self, key, value):
-        """Validate feedback text before setting"""
-        if value is None:
-            return None
-        
-        value = str(value).strip()
-        if not value:
-            return None
-        
-        if len(value) > 1000:
-            raise ValueError("feedback must not exceed 1000 characters")
-        
-        return value
+    # Load created_at with the INSERT (RETURNING, or a SELECT on dialects
+    # without it) so it is never expired when the rating is serialized
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self):
         return f"<UserRating(id={self.id}, question_id={self.question_id}, rating={self.rating})>"
\ No newline at end of file
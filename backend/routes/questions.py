@@ -1,95 +1,528 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import delete, insert, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import hashlib
 import json
-from pydantic import Field
+import logging
+import re
+from pydantic import ValidationError
 
 # Import database connection handler
-from database import get_db
+from config import get_settings
+from database import SessionLocal, get_db
 # Import database models
-from models import Question, QuestionSet, UserRating
+from models import Question, QuestionSet, QuestionSetItem, Tag, UserRating, question_tags
+# Import the shared cache and the stats cache invalidation hook
+from services.cache import get_cache
+from routes.stats import invalidate_stats
 # Import Pydantic schemas for request/response validation
 from schemas import (
-    QuestionCreate, Question as QuestionSchema, QuestionUpdate,
+    QuestionCreate, Question as QuestionSchema, QuestionUpdate, QuestionTypeName,
     QuestionGenerateRequest, QuestionSetCreate, QuestionSet as QuestionSetSchema,
     UserRatingCreate, UserRating as UserRatingSchema
 )
-# Import AI service for question generation
-from services.gemini_service import GeminiService
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI router for question-related endpoints
 router = APIRouter()
-# Initialize Gemini AI service
-gemini_service = GeminiService()
+JOB_TITLES_CACHE_KEY = "cache:job_titles"
+JOB_TITLES_CACHE_TTL = 300  # Seconds; bounds staleness across workers
 
-@router.post("/generate", response_model=List[QuestionSchema], status_code=status.HTTP_201_CREATED)
-async def generate_questions(
-    request: QuestionGenerateRequest = Field(..., description="Question generation parameters including job title, count, and type"),
-    db: Session = Depends(get_db)
-):
-    """Generate new interview questions using AI
+# Distinct job titles via a recursive "loose index scan": each step seeks the
+# next larger title on the job_title index, so the cost grows with the number
+# of distinct titles rather than the number of questions
+_DISTINCT_JOB_TITLES_STMT = text("""
+    WITH RECURSIVE titles(job_title) AS (
+        SELECT MIN(job_title) FROM questions
+        UNION ALL
+        SELECT (SELECT MIN(q.job_title) FROM questions q WHERE q.job_title > titles.job_title)
+        FROM titles
+        WHERE titles.job_title IS NOT NULL
+    )
+    SELECT job_title FROM titles WHERE job_title IS NOT NULL
+""")
+
+
+async def invalidate_job_titles() -> None:
+    """Drop the cached job title list after questions are added or removed"""
+    await get_cache().delete(JOB_TITLES_CACHE_KEY)
+
+
+# Response fields of the list endpoints. Rows read back from the database are
+# trusted, so list pages are projected straight to dicts and encoded by orjson
+# instead of being re-validated through Pydantic once per row.
+_QUESTION_FIELDS = tuple(QuestionSchema.model_fields)
+_QUESTION_SET_FIELDS = tuple(QuestionSetSchema.model_fields)
+# Question pages larger than this are streamed from a server-side cursor in
+# chunks, so the ORM objects of one chunk can be freed before the next loads
+STREAM_PAGE_THRESHOLD = 200
+STREAM_CHUNK_SIZE = 500
+
+# QuestionCreate's compiled validator and serializer, called directly in the
+# generation loop instead of through model_validate()/model_dump() per question
+_validate_question_create = QuestionCreate.__pydantic_validator__.validate_python
+_dump_question_create = QuestionCreate.__pydantic_serializer__.to_python
+
+
+def _project(row, fields: tuple) -> dict:
+    """Project an ORM object onto response fields.
     
     Args:
-        request: Contains job_title, count, and question_type for generation
-        db: Database session dependency
+        row: ORM object
+        fields: Attribute names to include
         
     Returns:
-        List of generated Question objects saved to database
+        Dict of the field values
+    """
+    return {field: getattr(row, field) for field in fields}
+
+
+def _list_response(items: List[dict], limit: int) -> ORJSONResponse:
+    """Serialize a keyset-paginated page of projected rows.
+    
+    The query fetches one row more than ``limit``; that extra row only tells
+    whether another page exists, so clients never need a COUNT(*) or an
+    extra request that comes back empty.
+    
+    Args:
+        items: Up to ``limit + 1`` projected rows, ordered by ID
+        limit: Requested page size
+        
+    Returns:
+        ORJSONResponse with the X-Has-More header, plus X-Next-Cursor when
+        another page exists
+    """
+    has_more = len(items) > limit
+    items = items[:limit]
+    headers = {"X-Has-More": "true" if has_more else "false"}
+    if has_more:
+        headers["X-Next-Cursor"] = str(items[-1]["id"])
+    return ORJSONResponse(items, headers=headers)
+
+
+# Gemini AI service, created on first use by get_gemini_service
+_gemini_service = None
+
+
+def get_gemini_service():
+    """Get or initialize the Gemini service lazily.
+    
+    The Gemini SDK and its transitive dependencies are only imported when
+    questions are first generated, keeping them off the worker boot path.
+    
+    Returns:
+        Shared GeminiService instance
         
     Raises:
-        HTTPException 400: If request parameters are invalid
-        HTTPException 500: If generation or database operations fail
-        HTTPException 503: If AI service is unavailable
+        HTTPException 503: If the AI service is not configured
     """
-    try:
-        if not request.job_title or not request.job_title.strip():
+    global _gemini_service
+    if _gemini_service is None:
+        from services.gemini_service import GeminiService, GeminiServiceError
+        try:
+            logger.info("Initializing Gemini service...")
+            _gemini_service = GeminiService()
+            logger.info("Gemini service initialized successfully")
+        except GeminiServiceError as e:
+            logger.error(f"Failed to initialize Gemini service: {e}")
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="job_title cannot be empty"
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="AI service is not configured"
             )
-        
-        if request.count < 1 or request.count > 100:
+    return _gemini_service
+
+
+class RequestLimiter:
+    """Async context manager capping concurrent requests in this worker.
+    
+    Unlike a plain semaphore it never queues: when all slots are taken the
+    request is rejected immediately with HTTP 503, so a burst of callers
+    fails fast instead of piling up behind slow upstream calls.
+    """
+    
+    def __init__(self, limit: int):
+        self._semaphore = asyncio.Semaphore(limit)
+    
+    async def __aenter__(self) -> None:
+        if self._semaphore.locked():
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="count must be between 1 and 100"
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many question generations in progress, please retry shortly",
+                headers={"Retry-After": "5"}
             )
+        await self._semaphore.acquire()
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._semaphore.release()
+
+
+# Each generation can make several Gemini calls; capping them per worker
+# keeps a burst of clients from running into Gemini's rate limits
+_generate_limiter = RequestLimiter(get_settings().concurrent_request_per_worker)
+
+# Generations running in this worker, by generation cache key: the count
+# being generated and the task saving the questions. An identical request
+# arriving meanwhile waits for that task instead of calling Gemini again.
+_inflight_generations: Dict[str, Tuple[int, asyncio.Task]] = {}
+
+
+def _forget_generation(cache_key: str, task: asyncio.Task) -> None:
+    """Drop a finished generation task from _inflight_generations.
+    
+    Args:
+        cache_key: Generation cache key the task was registered under
+        task: The finished task
+    """
+    if _inflight_generations.get(cache_key, (0, None))[1] is task:
+        del _inflight_generations[cache_key]
+    # Mark failures as retrieved even when no request was left waiting
+    if not task.cancelled():
+        task.exception()
+
+
+def _insert_ignore(table, dialect_name: str):
+    """Build an INSERT that silently skips rows violating a unique constraint.
+    
+    Args:
+        table: Table or mapped class to insert into
+        dialect_name: Name of the session's database dialect
+        
+    Returns:
+        Insert statement for the dialect
+    """
+    if dialect_name == 'postgresql':
+        return pg_insert(table).on_conflict_do_nothing()
+    if dialect_name == 'sqlite':
+        return sqlite_insert(table).on_conflict_do_nothing()
+    return insert(table).prefix_with('IGNORE')
+
+
+async def sync_question_tags(db: AsyncSession, questions: List[Question]) -> None:
+    """Replace the question_tags links of questions with their CSV tags.
+    
+    Missing tags are created first; the caller commits.
+    
+    Args:
+        db: Database session
+        questions: Flushed Question objects whose ``tags`` column is current
+    """
+    tags_by_question = {
+        q.id: {t.lower() for t in q.tags.split(',') if t} if q.tags else set()
+        for q in questions
+    }
+    all_names = set().union(*tags_by_question.values())
+    
+    await db.execute(
+        delete(question_tags).where(question_tags.c.question_id.in_(tags_by_question))
+    )
+    if not all_names:
+        return
+    
+    await db.execute(
+        _insert_ignore(Tag, db.bind.dialect.name),
+        [{"name": name} for name in all_names]
+    )
+    result = await db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(all_names)))
+    tag_ids = dict(result.all())
+    
+    await db.execute(
+        insert(question_tags),
+        [
+            {"question_id": q_id, "tag_id": tag_ids[name]}
+            for q_id, names in tags_by_question.items()
+            for name in names
+        ]
+    )
+
+
+async def bulk_create_questions(db: AsyncSession, rows: List[dict]) -> List[Question]:
+    """Insert many questions in a single transaction and commit.
+    
+    Uses an ORM-enabled INSERT so the rows are sent as one batched
+    executemany instead of a unit-of-work flush per object, with the
+    generated columns returned in the same round-trip. Dialects without
+    INSERT ... RETURNING (e.g. MySQL) fall back to a single flush of ORM
+    objects, which still runs in one transaction.
+    
+    Args:
+        db: Database session
+        rows: Validated question column values, one dict per question
+        
+    Returns:
+        The inserted Question objects, in the same order as ``rows``
+    """
+    if db.bind.dialect.insert_returning:
+        result = await db.scalars(
+            insert(Question).returning(Question, sort_by_parameter_order=True),
+            rows
+        )
+        questions = result.all()
+    else:
+        questions = [Question(**row) for row in rows]
+        db.add_all(questions)
+        await db.flush()
+    await sync_question_tags(db, questions)
+    await db.commit()
+    await invalidate_job_titles()
+    await invalidate_stats()
+    return questions
+
+
+async def ensure_questions_exist(db: AsyncSession, question_ids: List[int]) -> None:
+    """Check that all referenced questions exist with a single IN query.
+    
+    Args:
+        db: Database session
+        question_ids: Question IDs to check
+        
+    Raises:
+        HTTPException 404: If any of the questions doesn't exist
+    """
+    wanted_ids = set(question_ids)
+    existing_ids = set(
+        await db.scalars(select(Question.id).where(Question.id.in_(wanted_ids)))
+    )
+    missing_ids = sorted(wanted_ids - existing_ids)
+    if missing_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Questions with IDs {missing_ids} not found"
+            if len(missing_ids) > 1 else f"Question with ID {missing_ids[0]} not found"
+        )
+
+
+async def bulk_create_ratings(db: AsyncSession, ratings: List[UserRatingCreate]) -> List[UserRating]:
+    """Insert a batch of ratings in a single transaction and commit.
+    
+    All rated questions are checked with one query, then the ratings are
+    inserted as one batched INSERT like ``bulk_create_questions``.
+    
+    Args:
+        db: Database session
+        ratings: Validated ratings
+        
+    Returns:
+        The inserted UserRating objects, in the same order as ``ratings``
+        
+    Raises:
+        HTTPException 404: If any rated question doesn't exist
+    """
+    await ensure_questions_exist(db, [r.question_id for r in ratings])
+    
+    rows = [r.model_dump() for r in ratings]
+    if db.bind.dialect.insert_returning:
+        result = await db.scalars(
+            insert(UserRating).returning(UserRating, sort_by_parameter_order=True),
+            rows
+        )
+        db_ratings = result.all()
+    else:
+        db_ratings = [UserRating(**row) for row in rows]
+        db.add_all(db_ratings)
+        await db.flush()
+    await db.commit()
+    return db_ratings
+
+
+# Common abbreviations in job titles, expanded so variants share a cache entry
+_JOB_TITLE_ABBREVIATIONS = {
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "mgr": "manager",
+    "ml": "machine learning",
+    "swe": "software engineer",
+}
+_JOB_TITLE_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def _canonical_job_title(job_title: str) -> str:
+    """Reduce a job title to a canonical form for cache lookups.
+    
+    Case, punctuation, spacing and common abbreviations are ignored, so
+    "Sr. Backend Dev" and "senior backend developer" match.
+    
+    Args:
+        job_title: Job title as requested
+        
+    Returns:
+        Canonical job title
+    """
+    tokens = _JOB_TITLE_TOKEN_RE.findall(job_title.lower())
+    return " ".join(_JOB_TITLE_ABBREVIATIONS.get(token, token) for token in tokens)
+
+
+def _generation_cache_key(request: QuestionGenerateRequest) -> str:
+    """Build the cache key for a generation request.
+    
+    Equivalent job titles (see ``_canonical_job_title``) share a key. The
+    count is not part of the key: an entry generated for a larger count
+    also serves smaller requests.
+    
+    Args:
+        request: Generation request
+        
+    Returns:
+        Cache key for the request parameters
+    """
+    params = {
+        "job_title": _canonical_job_title(request.job_title),
+        "question_type": request.question_type,
+    }
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    return f"cache:gen:{digest}"
+
+
+async def _load_cached_questions(question_ids: List[int]) -> Optional[List[Question]]:
+    """Load previously generated questions by ID, in cached order.
+    
+    Args:
+        question_ids: IDs stored for a generation request
+        
+    Returns:
+        The questions, or None if any of them has since been deleted
+    """
+    async with SessionLocal() as db:
+        result = await db.scalars(select(Question).where(Question.id.in_(question_ids)))
+        by_id = {q.id: q for q in result}
+    if len(by_id) != len(question_ids):
+        return None
+    return [by_id[q_id] for q_id in question_ids]
+
+
+async def _generate_and_save(
+    request: QuestionGenerateRequest,
+    gemini_service,
+    cache_key: str
+) -> List[Question]:
+    """Generate questions with Gemini, save them and cache their IDs.
+    
+    Args:
+        request: Generation request
+        gemini_service: AI question generation service
+        cache_key: Generation cache key for the request
+        
+    Returns:
+        The saved questions
         
-        # Call Gemini AI service to generate interview questions based on parameters
-        generated_questions = gemini_service.generate_questions(
+    Raises:
+        HTTPException 503: If AI service is unavailable, returns no valid
+            questions or too many generations are already running
+    """
+    # Call Gemini AI service to generate interview questions based on parameters
+    async with _generate_limiter:
+        generated_questions = await gemini_service.generate_questions(
             job_title=request.job_title,
             count=request.count,
             question_type=request.question_type
         )
+    
+    if not generated_questions:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI service failed to generate questions"
+        )
+    
+    # AI output never passed through a request schema, so validate and
+    # normalize it here; rows the model got wrong are skipped
+    valid_questions = []
+    for q_data in generated_questions:
+        try:
+            valid_questions.append(_dump_question_create(_validate_question_create(q_data)))
+        except ValidationError as e:
+            logger.warning(f"Skipping invalid generated question: {e}")
+    
+    if not valid_questions:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI service did not return any valid questions"
+        )
+    
+    # Save all generated questions in one batched insert; leaving the
+    # session block rolls back anything uncommitted on error
+    async with SessionLocal() as db:
+        saved_questions = await bulk_create_questions(db, valid_questions)
+    
+    await get_cache().set(
+        cache_key,
+        {"count": request.count, "ids": [q.id for q in saved_questions]},
+        get_settings().generation_cache_ttl
+    )
+    return saved_questions
+
+
+@router.post("/generate", response_model=List[QuestionSchema], status_code=status.HTTP_201_CREATED)
+async def generate_questions(
+    request: QuestionGenerateRequest = Body(..., description="Question generation parameters including job title, count, and type"),
+    gemini_service=Depends(get_gemini_service)
+):
+    """Generate new interview questions using AI
+    
+    Gemini calls run concurrently on the event loop with no database
+    session open; a session is only opened for the final insert, so slow
+    generations don't hold pool connections. Results are cached by
+    canonical job title and question type, and a repeated or smaller
+    request returns the questions saved for it unless ``no_cache`` is set.
+    Such a request arriving while the first is still generating waits for
+    and shares its result.
+    
+    Args:
+        request: Contains job_title, count, and question_type for generation
+        gemini_service: AI question generation service dependency
         
-        if not generated_questions:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="AI service failed to generate questions"
-            )
+    Returns:
+        List of generated Question objects saved to database
         
-        # Save each generated question to the database
-        saved_questions = []
-        for q_data in generated_questions:
-            question = Question(**q_data)  # Create ORM object from dict
-            db.add(question)
-            db.commit()  # Commit each question individually
-            db.refresh(question)  # Refresh to get auto-generated values like ID
-            saved_questions.append(question)
+    Raises:
+        HTTPException 400: If request parameters are invalid
+        HTTPException 500: If generation or database operations fail
+        HTTPException 503: If AI service is unavailable or too many
+            generations are already running in this worker
+    """
+    try:
+        cache = get_cache()
+        cache_key = _generation_cache_key(request)
+        if not request.no_cache:
+            cached = await cache.get(cache_key)
+            # Entries record the count they were generated for, so a short
+            # AI response still serves repeats of the same request
+            if isinstance(cached, dict) and cached["count"] >= request.count:
+                cached_questions = await _load_cached_questions(cached["ids"][:request.count])
+                if cached_questions is not None:
+                    return cached_questions
+        
+        inflight = None if request.no_cache else _inflight_generations.get(cache_key)
+        if inflight is None or inflight[0] < request.count:
+            # The generation runs in its own task so it isn't tied to the
+            # request that started it
+            task = asyncio.ensure_future(_generate_and_save(request, gemini_service, cache_key))
+            task.add_done_callback(lambda t: _forget_generation(cache_key, t))
+            inflight = (request.count, task)
+            _inflight_generations[cache_key] = inflight
         
-        return saved_questions
+        # Shielded so a client that gives up, the first one included, doesn't
+        # cancel the shared generation; it still completes and is cached
+        saved_questions = await asyncio.shield(inflight[1])
+        return saved_questions[:request.count]
     
     except HTTPException:
-        db.rollback()
         raise
     except ValueError as e:
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid input: {str(e)}"
         )
     except Exception as e:
-        # Rollback transaction on error to maintain database integrity
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to generate questions: {str(e)}"
@@ -100,8 +533,15 @@ async def get_questions(
     skip: int = Query(
         0,
         ge=0,
-        description="Number of records to skip for pagination",
-        title="Pagination Offset"
+        description="Number of records to skip for pagination (deprecated, use after_id)",
+        title="Pagination Offset",
+        deprecated=True
+    ),
+    after_id: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Return records with an ID greater than this cursor (value of X-Next-Cursor)",
+        title="Pagination Cursor"
     ),
     limit: int = Query(
         100,
@@ -115,9 +555,9 @@ async def get_questions(
         description="Filter by job title (case-insensitive partial match)",
         title="Job Title Filter"
     ),
-    question_type: Optional[str] = Query(
+    question_type: Optional[QuestionTypeName] = Query(
         None,
-        description="Filter by question type: 'technical' or 'behavioral'",
+        description="Filter by question type: 'technical', 'behavioral', or 'mixed'",
         title="Question Type Filter"
     ),
     flagged_only: bool = Query(
@@ -125,11 +565,18 @@ async def get_questions(
         description="If True, return only flagged questions",
         title="Flagged Questions Only"
     ),
-    db: Session = Depends(get_db)
+    tag: Optional[str] = Query(
+        None,
+        description="Filter by tag (case-insensitive exact match)",
+        title="Tag Filter"
+    ),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get questions with filtering and pagination options
     
-    Returns paginated list of questions with optional filtering by job title, type, and flagged status.
+    Returns paginated list of questions with optional filtering by job title, type, tag, and flagged status.
+    Pages are keyset-paginated on ID: the X-Has-More response header tells
+    whether another page exists, and X-Next-Cursor then holds its ``after_id``.
     
     Raises:
         HTTPException 400: If pagination parameters are invalid
@@ -137,30 +584,46 @@ async def get_questions(
     """
     try:
         # Build the base query
-        query = db.query(Question)
+        query = select(Question)
         
         # Apply filters based on parameters if provided
         if job_title and job_title.strip():
-            # Case-insensitive partial matching for job title
-            query = query.filter(Question.job_title.ilike(f"%{job_title}%"))
+            # Case-insensitive partial matching for job title; the pattern is
+            # sent as a bound parameter, so the compiled SQL is identical for
+            # every title and is served from the statement cache
+            query = query.where(Question.job_title.ilike(f"%{job_title}%"))
         
         if question_type:
-            # Validate question type
-            if question_type not in ['technical', 'behavioral', 'mixed']:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="question_type must be 'technical', 'behavioral', or 'mixed'"
-                )
             # Exact matching for question type
-            query = query.filter(Question.question_type == question_type)
+            query = query.where(Question.question_type == question_type)
         
         if flagged_only:
             # Filter only flagged questions
-            query = query.filter(Question.is_flagged == True)
+            query = query.where(Question.is_flagged == True)
+        
+        if tag and tag.strip():
+            # Indexed lookup through the question_tags association
+            tagged_ids = (
+                select(question_tags.c.question_id)
+                .join(Tag, Tag.id == question_tags.c.tag_id)
+                .where(Tag.name == tag.strip().lower())
+            )
+            query = query.where(Question.id.in_(tagged_ids))
+        
+        if after_id is not None:
+            # Keyset pagination: seek past the cursor on the primary key index
+            query = query.where(Question.id > after_id)
         
-        # Execute query with pagination
-        questions = query.offset(skip).limit(limit).all()
-        return questions
+        # Execute query with pagination; ordering by id keeps pages stable
+        query = query.order_by(Question.id).offset(skip).limit(limit + 1)
+        if limit > STREAM_PAGE_THRESHOLD:
+            stream = await db.stream_scalars(
+                query.execution_options(yield_per=STREAM_CHUNK_SIZE)
+            )
+            items = [_project(q, _QUESTION_FIELDS) async for q in stream]
+        else:
+            items = [_project(q, _QUESTION_FIELDS) for q in await db.scalars(query)]
+        return _list_response(items, limit)
     
     except HTTPException:
         raise
@@ -172,8 +635,8 @@ async def get_questions(
 
 @router.get("/{question_id}", response_model=QuestionSchema, status_code=status.HTTP_200_OK)
 async def get_question(
-    question_id: int = Field(..., gt=0, description="Unique identifier of the question"),
-    db: Session = Depends(get_db)
+    question_id: int = Path(..., gt=0, description="Unique identifier of the question"),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get a specific question by ID
     
@@ -185,14 +648,8 @@ async def get_question(
         HTTPException 500: If database query fails
     """
     try:
-        if question_id <= 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="question_id must be a positive integer"
-            )
-        
-        # Query for specific question by ID
-        question = db.query(Question).filter(Question.id == question_id).first()
+        # Primary key lookup through the identity map
+        question = await db.get(Question, question_id)
         if not question:
             # Return 404 if question not found
             raise HTTPException(
@@ -211,8 +668,8 @@ async def get_question(
 
 @router.post("/", response_model=QuestionSchema, status_code=status.HTTP_201_CREATED)
 async def create_question(
-    question: QuestionCreate = Field(..., description="Question data to create"),
-    db: Session = Depends(get_db)
+    question: QuestionCreate = Body(..., description="Question data to create"),
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new question manually
     
@@ -231,46 +688,30 @@ async def create_question(
         HTTPException 500: If database operation fails
     """
     try:
-        # Validate question data
-        if not question.question_text or not question.question_text.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="question_text cannot be empty"
-            )
-        
-        if question.question_type not in ['technical', 'behavioral', 'mixed']:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="question_type must be 'technical', 'behavioral', or 'mixed'"
-            )
-        
-        if question.difficulty and (question.difficulty < 1 or question.difficulty > 5):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="difficulty must be between 1 and 5"
-            )
-        
-        # Convert Pydantic model to dictionary and create ORM object
-        db_question = Question(**question.dict())
-        # Add to session and commit to database
+        # Convert Pydantic model to dictionary and create ORM object;
+        # omitted optional fields fall back to the column defaults
+        db_question = Question(**question.model_dump(exclude_none=True))
+        # Add to session and flush to get the ID before linking tags
         db.add(db_question)
-        db.commit()
-        # Refresh to get auto-generated values
-        db.refresh(db_question)
+        await db.flush()
+        await sync_question_tags(db, [db_question])
+        await db.commit()
+        await invalidate_job_titles()
+        await invalidate_stats()
         return db_question
     
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except ValueError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid data: {str(e)}"
         )
     except Exception as e:
         # Rollback on error
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create question: {str(e)}"
@@ -278,9 +719,9 @@ async def create_question(
 
 @router.put("/{question_id}", response_model=QuestionSchema, status_code=status.HTTP_200_OK)
 async def update_question(
-    question_id: int = Field(..., gt=0, description="Unique identifier of the question to update"),
-    question_update: QuestionUpdate = Field(..., description="Fields to update"),
-    db: Session = Depends(get_db)
+    question_id: int = Path(..., gt=0, description="Unique identifier of the question to update"),
+    question_update: QuestionUpdate = Body(..., description="Fields to update"),
+    db: AsyncSession = Depends(get_db)
 ):
     """Update an existing question
     
@@ -300,53 +741,56 @@ async def update_question(
         HTTPException 500: If update operation fails
     """
     try:
-        # Validate question_id
-        if question_id <= 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="question_id must be a positive integer"
-            )
+        update_data = question_update.model_dump(exclude_unset=True)
+        
+        # difficulty and is_flagged are NOT NULL; an explicit null leaves them unchanged
+        for field in ('difficulty', 'is_flagged'):
+            if field in update_data and update_data[field] is None:
+                del update_data[field]
+        
+        if update_data:
+            # Update only the fields that were provided in a single
+            # UPDATE ... RETURNING; no row back means the question doesn't exist
+            stmt = update(Question).where(Question.id == question_id).values(**update_data)
+            if db.bind.dialect.update_returning:
+                result = await db.execute(stmt.returning(Question))
+                question = result.scalar_one_or_none()
+            else:
+                # Dialects without RETURNING (e.g. MySQL) reload the row
+                result = await db.execute(stmt)
+                question = (
+                    await db.get(Question, question_id, populate_existing=True)
+                    if result.rowcount else None
+                )
+        else:
+            question = await db.get(Question, question_id)
         
-        # First check if the question exists
-        question = db.query(Question).filter(Question.id == question_id).first()
         if not question:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Question with ID {question_id} not found"
             )
         
-        # Validate update data
-        update_data = question_update.dict(exclude_unset=True)
-        
-        if 'difficulty' in update_data and update_data['difficulty']:
-            if update_data['difficulty'] < 1 or update_data['difficulty'] > 5:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="difficulty must be between 1 and 5"
-                )
-        
-        # Update only the fields that were provided
-        for field, value in update_data.items():
-            setattr(question, field, value)
+        if 'tags' in update_data:
+            await sync_question_tags(db, [question])
         
         # Commit changes to database
-        db.commit()
-        # Refresh to get updated values
-        db.refresh(question)
+        await db.commit()
+        await invalidate_stats()
         return question
     
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except ValueError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid data: {str(e)}"
         )
     except Exception as e:
         # Rollback on error
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update question: {str(e)}"
@@ -354,8 +798,8 @@ async def update_question(
 
 @router.delete("/{question_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_question(
-    question_id: int = Field(..., gt=0, description="Unique identifier of the question to delete"),
-    db: Session = Depends(get_db)
+    question_id: int = Path(..., gt=0, description="Unique identifier of the question to delete"),
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a question
     
@@ -374,31 +818,25 @@ async def delete_question(
         HTTPException 500: If delete operation fails
     """
     try:
-        # Validate question_id
-        if question_id <= 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="question_id must be a positive integer"
-            )
-        
-        # First check if the question exists
-        question = db.query(Question).filter(Question.id == question_id).first()
-        if not question:
+        # Single DELETE; tag links, set links and ratings go with it through
+        # their ON DELETE CASCADE foreign keys. No row deleted means the
+        # question doesn't exist
+        result = await db.execute(delete(Question).where(Question.id == question_id))
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Question with ID {question_id} not found"
             )
-        
-        # Remove from database
-        db.delete(question)
-        db.commit()
+        await db.commit()
+        await invalidate_job_titles()
+        await invalidate_stats()
     
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except Exception as e:
         # Rollback on error
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete question: {str(e)}"
@@ -406,8 +844,8 @@ async def delete_question(
 
 @router.post("/sets", response_model=QuestionSetSchema, status_code=status.HTTP_201_CREATED)
 async def create_question_set(
-    question_set: QuestionSetCreate = Field(..., description="Question set data including name and question IDs"),
-    db: Session = Depends(get_db)
+    question_set: QuestionSetCreate = Body(..., description="Question set data including name and question IDs"),
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new question set
     
@@ -426,62 +864,43 @@ async def create_question_set(
         HTTPException 500: If database operation fails
     """
     try:
-        # Validate set data
-        if not question_set.name or not question_set.name.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="name cannot be empty"
-            )
-        
-        if not question_set.job_title or not question_set.job_title.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="job_title cannot be empty"
-            )
-        
-        if not question_set.question_ids:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="question_ids list cannot be empty"
-            )
+        # Verify all question IDs exist in one round-trip
+        await ensure_questions_exist(db, question_set.question_ids)
         
-        # Verify all question IDs exist
-        for q_id in question_set.question_ids:
-            question = db.query(Question).filter(Question.id == q_id).first()
-            if not question:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Question with ID {q_id} not found"
-                )
-        
-        # Convert question IDs list to JSON string for storage
-        question_ids_json = json.dumps(question_set.question_ids)
         # Create new QuestionSet object
         db_set = QuestionSet(
             name=question_set.name,
             description=question_set.description,
-            job_title=question_set.job_title,
-            question_ids=question_ids_json  # Store as JSON string in database
+            job_title=question_set.job_title
         )
-        # Add to session and commit to database
+        # Add to session and flush to get the ID before linking questions
         db.add(db_set)
-        db.commit()
-        # Refresh to get auto-generated values
-        db.refresh(db_set)
+        await db.flush()
+        # Items carry their full primary key, so the flush sends them as a
+        # single executemany INSERT
+        items = [
+            QuestionSetItem(set_id=db_set.id, question_id=q_id, position=position)
+            for position, q_id in enumerate(question_set.question_ids)
+        ]
+        db.add_all(items)
+        await db.commit()
+        await invalidate_stats()
+        # Populate the read-only collection directly instead of issuing another SELECT
+        set_committed_value(db_set, "items", items)
         return db_set
     
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except ValueError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid data: {str(e)}"
         )
     except Exception as e:
         # Rollback on error
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create question set: {str(e)}"
@@ -492,8 +911,15 @@ async def get_question_sets(
     skip: int = Query(
         0,
         ge=0,
-        description="Number of records to skip for pagination",
-        title="Pagination Offset"
+        description="Number of records to skip for pagination (deprecated, use after_id)",
+        title="Pagination Offset",
+        deprecated=True
+    ),
+    after_id: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Return records with an ID greater than this cursor (value of X-Next-Cursor)",
+        title="Pagination Cursor"
     ),
     limit: int = Query(
         100,
@@ -502,14 +928,17 @@ async def get_question_sets(
         description="Maximum number of records to return (max 1000)",
         title="Pagination Limit"
     ),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get all question sets
     
     Retrieves paginated list of all question sets in the system.
+    The X-Has-More response header tells whether another page exists, and
+    X-Next-Cursor then holds its ``after_id``.
     
     Args:
-        skip: Number of records to skip (pagination offset)
+        skip: Number of records to skip (deprecated pagination offset)
+        after_id: Return sets with an ID greater than this cursor
         limit: Maximum number of records to return (pagination limit)
         db: Database session dependency
         
@@ -521,9 +950,15 @@ async def get_question_sets(
         HTTPException 500: If database query fails
     """
     try:
-        # Query all sets with pagination
-        sets = db.query(QuestionSet).offset(skip).limit(limit).all()
-        return sets
+        # Query all sets with keyset pagination on the primary key; the items
+        # of the whole page come from one extra IN query, not one per set
+        query = select(QuestionSet).options(selectinload(QuestionSet.items))
+        if after_id is not None:
+            query = query.where(QuestionSet.id > after_id)
+        result = await db.execute(query.order_by(QuestionSet.id).offset(skip).limit(limit + 1))
+        return _list_response(
+            [_project(s, _QUESTION_SET_FIELDS) for s in result.scalars()], limit
+        )
     
     except Exception as e:
         raise HTTPException(
@@ -533,8 +968,8 @@ async def get_question_sets(
 
 @router.post("/rate", response_model=UserRatingSchema, status_code=status.HTTP_201_CREATED)
 async def rate_question(
-    rating: UserRatingCreate = Field(..., description="Rating data including question_id, rating value (1-5), and optional feedback"),
-    db: Session = Depends(get_db)
+    rating: UserRatingCreate = Body(..., description="Rating data including question_id, rating value (1-5), and optional feedback"),
+    db: AsyncSession = Depends(get_db)
 ):
     """Rate a question
     
@@ -553,53 +988,74 @@ async def rate_question(
         HTTPException 500: If database operation fails
     """
     try:
-        # Verify question exists
-        question = db.query(Question).filter(Question.id == rating.question_id).first()
-        if not question:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Question with ID {rating.question_id} not found"
-            )
-        
-        # Validate rating value
-        if rating.rating < 1.0 or rating.rating > 5.0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="rating must be between 1.0 and 5.0"
-            )
-        
-        # Create new UserRating object from request data
-        db_rating = UserRating(**rating.dict())
-        # Add to session and commit to database
-        db.add(db_rating)
-        db.commit()
-        # Refresh to get auto-generated values
-        db.refresh(db_rating)
-        return db_rating
+        # Same path as the batch endpoint with a batch of one
+        db_ratings = await bulk_create_ratings(db, [rating])
+        return db_ratings[0]
     
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except ValueError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid data: {str(e)}"
         )
     except Exception as e:
         # Rollback on error
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to rate question: {str(e)}"
         )
 
+@router.post("/rate/batch", response_model=List[UserRatingSchema], status_code=status.HTTP_201_CREATED)
+async def rate_questions_batch(
+    ratings: List[UserRatingCreate] = Body(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Ratings to record, up to 500 per request"
+    ),
+    db: AsyncSession = Depends(get_db)
+):
+    """Rate several questions in one request
+    
+    Records all ratings in a single transaction: either every rating is
+    saved or none are.
+    
+    Args:
+        ratings: List of rating data (question_id, rating value, feedback)
+        db: Database session dependency
+        
+    Returns:
+        Created UserRating objects, in request order
+        
+    Raises:
+        HTTPException 404: If any rated question doesn't exist
+        HTTPException 500: If database operation fails
+    """
+    try:
+        return await bulk_create_ratings(db, ratings)
+    
+    except HTTPException:
+        await db.rollback()
+        raise
+    except Exception as e:
+        # Rollback on error
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to rate questions: {str(e)}"
+        )
+
 @router.get("/job-titles/", response_model=List[str], status_code=status.HTTP_200_OK)
-async def get_job_titles(db: Session = Depends(get_db)):
+async def get_job_titles(db: AsyncSession = Depends(get_db)):
     """Get all unique job titles
     
     Retrieves a list of all distinct job titles from questions in the database.
-    Useful for filtering and categorization.
+    Useful for filtering and categorization. The list is cached for a few
+    minutes and invalidated when questions are created or deleted.
     
     Args:
         db: Database session dependency
@@ -611,10 +1067,16 @@ async def get_job_titles(db: Session = Depends(get_db)):
         HTTPException 500: If database query fails
     """
     try:
+        cache = get_cache()
+        job_titles = await cache.get(JOB_TITLES_CACHE_KEY)
+        if job_titles is not None:
+            return job_titles
+        
         # Query for distinct job titles in the database
-        job_titles = db.query(Question.job_title).distinct().all()
-        # Convert from list of tuples to list of strings, filter out None values
-        return [title[0] for title in job_titles if title[0]]
+        result = await db.execute(_DISTINCT_JOB_TITLES_STMT)
+        job_titles = list(result.scalars().all())
+        await cache.set(JOB_TITLES_CACHE_KEY, job_titles, JOB_TITLES_CACHE_TTL)
+        return job_titles
     
     except Exception as e:
         raise HTTPException(
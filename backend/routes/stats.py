@@ -1,69 +1,98 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, HTTPException, status
+from sqlalchemy import case, func, select
+import asyncio
 
-from database import get_db
-from models import Question, QuestionSet, UserRating
+from database import SessionLocal
+from models import Question, QuestionSet
 from schemas import StatsResponse
+from services.cache import get_cache
 
 router = APIRouter()
+STATS_CACHE_KEY = "cache:stats"
+STATS_CACHE_TTL = 60  # Seconds; bounds staleness across workers
+
+# Scalar aggregates in one statement: total questions, average difficulty,
+# flagged questions and total question sets
+_TOTALS_STMT = select(
+    func.count(Question.id),
+    func.avg(Question.difficulty),
+    func.sum(case((Question.is_flagged == True, 1), else_=0)),
+    select(func.count(QuestionSet.id)).scalar_subquery(),
+)
+_BY_TYPE_STMT = select(Question.question_type, func.count(Question.id)).group_by(Question.question_type)
+_BY_JOB_TITLE_STMT = select(Question.job_title, func.count(Question.id)).group_by(Question.job_title)
+
+
+async def invalidate_stats() -> None:
+    """Drop the cached statistics after questions or question sets change"""
+    await get_cache().delete(STATS_CACHE_KEY)
+
+
+async def _fetch_all(stmt) -> list:
+    """Run a statement on its own session and return all rows.
+    
+    An AsyncSession can't run statements concurrently, so each of the
+    gathered stats queries checks out its own pool connection.
+    
+    Args:
+        stmt: Statement to execute
+    
+    Returns:
+        List of result rows
+    """
+    async with SessionLocal() as session:
+        result = await session.execute(stmt)
+        return result.all()
+
 
 @router.get("/", response_model=StatsResponse, status_code=status.HTTP_200_OK)
-async def get_stats(db: Session = Depends(get_db)):
+async def get_stats():
     """Get comprehensive platform statistics
     
     Retrieves aggregated statistics including total questions, breakdown by type and job title,
     average difficulty, flagged questions count, and total question sets.
+    Results are cached for STATS_CACHE_TTL seconds and dropped on writes.
+    On a cache miss the three independent queries run concurrently, each on
+    its own connection, so the wait is that of the slowest query.
     
-    Args:
-        db: Database session dependency
-        
     Returns:
         StatsResponse object containing all platform statistics
-        
+    
     Raises:
         HTTPException 500: If database query or aggregation fails
     """
     try:
-        # Total questions
-        total_questions = db.query(func.count(Question.id)).scalar() or 0
+        cache = get_cache()
+        cached_stats = await cache.get(STATS_CACHE_KEY)
+        if cached_stats is not None:
+            return cached_stats
         
-        # Questions by type
-        type_stats = db.query(
-            Question.question_type,
-            func.count(Question.id)
-        ).group_by(Question.question_type).all()
+        totals, type_stats, job_stats = await asyncio.gather(
+            _fetch_all(_TOTALS_STMT),
+            _fetch_all(_BY_TYPE_STMT),
+            _fetch_all(_BY_JOB_TITLE_STMT),
+        )
+        total_questions, avg_difficulty, flagged_count, total_sets = totals[0]
         
+        # Questions by type
         questions_by_type = {type_name: count for type_name, count in type_stats if type_name}
         
         # Questions by job title
-        job_stats = db.query(
-            Question.job_title,
-            func.count(Question.id)
-        ).group_by(Question.job_title).all()
-        
         questions_by_job_title = {job_title: count for job_title, count in job_stats if job_title}
         
-        # Average difficulty
-        avg_difficulty = db.query(func.avg(Question.difficulty)).scalar() or 0.0
-        
-        # Flagged questions
-        flagged_count = db.query(func.count(Question.id)).filter(Question.is_flagged == True).scalar() or 0
-        
-        # Total question sets
-        total_sets = db.query(func.count(QuestionSet.id)).scalar() or 0
-        
-        return StatsResponse(
-            total_questions=total_questions,
+        stats = StatsResponse(
+            total_questions=total_questions or 0,
             questions_by_type=questions_by_type,
             questions_by_job_title=questions_by_job_title,
-            average_difficulty=float(avg_difficulty),
-            flagged_questions=flagged_count,
-            total_question_sets=total_sets
+            average_difficulty=float(avg_difficulty or 0.0),
+            flagged_questions=flagged_count or 0,
+            total_question_sets=total_sets or 0
         )
+        await cache.set(STATS_CACHE_KEY, stats.model_dump(), STATS_CACHE_TTL)
+        return stats
     
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve statistics: {str(e)}"
-        )
\ No newline at end of file
+        )
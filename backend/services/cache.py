@@ -0,0 +1,128 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryCache:
+    """In-process TTL cache with least-recently-used eviction.
+
+    Used when no Redis server is configured. Entries are per worker process.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._max_entries = max_entries
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store a value for ``ttl`` seconds.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds
+        """
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """Remove a value if present.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+
+class RedisCache:
+    """Redis-backed cache shared by all workers; values are stored as JSON.
+
+    Redis errors are logged and treated as cache misses so an unavailable
+    cache never fails a request.
+    """
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+        self._client = redis.Redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or Redis is unavailable
+        """
+        try:
+            raw = await self._client.get(key)
+        except Exception as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store a value for ``ttl`` seconds.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value to store
+            ttl: Time to live in seconds
+        """
+        try:
+            await self._client.setex(key, ttl, json.dumps(value))
+        except Exception as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+
+    async def delete(self, key: str) -> None:
+        """Remove a value if present.
+
+        Args:
+            key: Cache key
+        """
+        try:
+            await self._client.delete(key)
+        except Exception as e:
+            logger.warning(f"Cache delete failed for {key}: {e}")
+
+
+@lru_cache
+def get_cache():
+    """Get the application cache, using Redis when REDIS_URL is configured.
+
+    Returns:
+        Shared RedisCache or MemoryCache instance
+    """
+    redis_url = get_settings().redis_url
+    if redis_url:
+        logger.info("Using Redis cache")
+        return RedisCache(redis_url)
+    logger.info("REDIS_URL not set, using in-process cache")
+    return MemoryCache()
@@ -1,27 +1,103 @@
 import google.generativeai as genai
-import os
-import json
+from google.api_core import exceptions as google_exceptions
+import asyncio
 import logging
-from typing import List, Dict, Optional
-from dotenv import load_dotenv
+import random
+import re
+import orjson
+from functools import lru_cache
+from typing import FrozenSet, List, Dict, Optional
+
+from config import get_settings
 
 # Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-
 
 class GeminiServiceError(Exception):
     """Custom exception for Gemini service errors"""
     pass
 
 
+# Runs of characters the tag schema rejects (tags allow letters, digits, _ and -)
+_INVALID_TAG_CHARS_RE = re.compile(r"[^\w\-]+")
+# Same limit as the Tags schema type
+_MAX_TAGS_LENGTH = 500
+
+
+# Prompt pieces per question type: (focus, instruction)
+_PROMPT_FOCUS = {
+    "technical": (
+        "technical skills, coding problems, system design, and domain-specific knowledge",
+        "Ensure questions are technically relevant to the specific role and include problems that test their expertise.",
+    ),
+    "behavioral": (
+        "soft skills, past experiences, teamwork, leadership, and problem-solving scenarios",
+        "Create scenario-based questions that reveal how the candidate handles real workplace situations.",
+    ),
+    "mixed": (
+        "a mix of technical skills and behavioral aspects",
+        "Balance technical and behavioral questions to assess both skills and cultural fit.",
+    ),
+}
+
+# The instructions that never change come first so every request shares the
+# same prompt prefix, which Gemini's implicit prefix caching can reuse; the
+# request-specific task follows at the end. The reply format is enforced by
+# RESPONSE_SCHEMA, so only the meaning of the fields is described here
+_PROMPT_TEMPLATE = """You are an expert technical interviewer.
+Answer with interview questions; "type" is technical or behavioral and "tags" are comma-separated keywords.
+Vary "difficulty" from 1 (entry-level knowledge) through 3 (mid-level experience) to 5 (senior/expert).
+
+Task: Generate exactly {count} high-quality, realistic interview questions for a {job_title} position.
+Focus on {focus}. {instruction}
+"""
+
+
+@lru_cache(maxsize=1)
+def _available_models() -> FrozenSet[str]:
+    """List the models this API key can call generateContent on.
+    
+    Fetched with a single list_models() call per process; failures are not
+    cached, so a later call retries.
+    
+    Returns:
+        Model names without the ``models/`` prefix
+    """
+    return frozenset(
+        m.name.removeprefix("models/")
+        for m in genai.list_models()
+        if "generateContent" in m.supported_generation_methods
+    )
+
+
+@lru_cache(maxsize=128)
+def _generation_config(temperature: float, max_output_tokens: int):
+    """Build the generation settings for one attempt, reusing identical ones.
+    
+    Args:
+        temperature: Sampling temperature
+        max_output_tokens: Output token budget for the reply
+        
+    Returns:
+        genai.types.GenerationConfig for JSON-mode generation
+    """
+    return genai.types.GenerationConfig(
+        temperature=temperature,
+        top_p=0.95,
+        top_k=40,
+        max_output_tokens=max_output_tokens,
+        candidate_count=1,
+        response_mime_type="application/json",
+        response_schema=GeminiService.RESPONSE_SCHEMA,
+    )
+
+
 class GeminiService:
     """Service for generating interview questions using Google's Gemini API.
     
-    This service provides AI-powered question generation with fallback mechanisms
-    and multiple parsing strategies for robustness.
+    This service provides AI-powered question generation using Gemini's
+    structured JSON output, with a retry for questions the model left out.
     """
     
     # Cache for model initialization
@@ -30,15 +106,60 @@ class GeminiService:
     
     # Constants for configuration
     MAX_GENERATION_ATTEMPTS = 2
-    DEFAULT_TEMPERATURE = 0.7
-    RETRY_TEMPERATURE = 0.5
     DEFAULT_COUNT = 5
     MAX_COUNT = 100
+    # Same limit as the JobTitle schema; also guards callers that bypass
+    # the API so an oversized title never reaches the prompt
+    MAX_JOB_TITLE_LENGTH = 100
     DEFAULT_DIFFICULTY = 3
     MIN_DIFFICULTY = 1
     MAX_DIFFICULTY = 5
     VALID_QUESTION_TYPES = {'technical', 'behavioral', 'mixed'}
-    MODEL_NAMES = ['gemini-1.5-pro', 'gemini-pro']
+    # Model preference order; the first one available to the API key is used
+    # All of them support JSON mode (response_mime_type/response_schema)
+    MODEL_NAMES = ['gemini-1.5-pro', 'gemini-1.5-flash']
+    # Questions requested per prompt; larger requests are split into
+    # batches generated concurrently
+    BATCH_SIZE = 50
+    MAX_CONCURRENT_REQUESTS = 5
+    # Output token budget per prompt, scaled to the questions requested. A
+    # reply cut off at the limit is invalid JSON and loses the whole batch,
+    # so the per-question allowance is generous; the cap fits BATCH_SIZE
+    TOKENS_PER_QUESTION = 256
+    MIN_OUTPUT_TOKENS = 1024
+    MAX_OUTPUT_TOKENS = 8192
+    # Retries after a 429/quota or transient server error, waiting about
+    # 1s, 2s, 4s plus up to 25% random jitter so concurrent batches spread out
+    RETRY_LIMIT = 3
+    RETRY_BACKOFF = 1.0
+    RETRYABLE_ERRORS = (
+        google_exceptions.ResourceExhausted,
+        google_exceptions.TooManyRequests,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.InternalServerError,
+    )
+    # Errors another attempt can't fix (bad request or credentials)
+    PERMANENT_ERRORS = (
+        google_exceptions.InvalidArgument,
+        google_exceptions.PermissionDenied,
+        google_exceptions.Unauthenticated,
+    )
+    # Structured output schema: in JSON mode the model can only answer with
+    # an array of these objects, so the response is parsed with one loads()
+    RESPONSE_SCHEMA = {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "question": {"type": "string"},
+                "type": {"type": "string"},
+                "difficulty": {"type": "integer"},
+                "tags": {"type": "string"},
+            },
+            "required": ["question", "difficulty"],
+        },
+    }
     
     def __init__(self):
         """Initialize Gemini service and configure the API connection (lazy model loading).
@@ -47,7 +168,8 @@ class GeminiService:
             GeminiServiceError: If API key is not properly configured
         """
         try:
-            api_key = os.getenv("GEMINI_API_KEY")
+            settings = get_settings()
+            api_key = settings.gemini_api_key
             if not api_key or api_key == "your-gemini-api-key":
                 error_msg = "GEMINI_API_KEY environment variable not set or using placeholder value"
                 logger.warning(error_msg)
@@ -58,6 +180,13 @@ class GeminiService:
                 genai.configure(api_key=api_key)
                 GeminiService._api_configured = True
                 logger.info("Gemini API configured successfully")
+            
+            # Retries reuse the same temperature; lowering it doesn't make
+            # a JSON-mode reply more complete, it only makes it less varied
+            self._temperature = settings.gemini_temperature
+            
+            # Bounds concurrent API calls made by generate_questions
+            self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
         
         except GeminiServiceError:
             raise
@@ -67,33 +196,38 @@ class GeminiService:
     def _get_model(self):
         """Lazily initialize the model on first use.
         
-        Tries multiple model names with fallback mechanism.
+        GenerativeModel() does not check that a model exists, so the first
+        entry of MODEL_NAMES that appears in the account's model list is
+        chosen instead. If the list can't be fetched, the first preference
+        is used.
         
         Returns:
             genai.GenerativeModel: Initialized Gemini model
             
         Raises:
-            GeminiServiceError: If all model initialization attempts fail
+            GeminiServiceError: If none of MODEL_NAMES is available
         """
         if GeminiService._model is not None:
             return GeminiService._model
         
-        last_error = None
-        for model_name in self.MODEL_NAMES:
-            try:
-                GeminiService._model = genai.GenerativeModel(model_name)
-                logger.info(f"Successfully initialized {model_name} model")
-                return GeminiService._model
-            
-            except Exception as e:
-                last_error = e
-                logger.warning(f"Failed to initialize {model_name}: {str(e)}")
-                continue
+        try:
+            available = _available_models()
+        except Exception as e:
+            logger.warning(f"Could not list Gemini models, using {self.MODEL_NAMES[0]}: {str(e)}")
+            available = None
         
-        # All attempts failed
-        raise GeminiServiceError(
-            f"Failed to initialize any Gemini model. Last error: {str(last_error)}"
+        model_name = next(
+            (name for name in self.MODEL_NAMES if available is None or name in available),
+            None
         )
+        if model_name is None:
+            raise GeminiServiceError(
+                f"None of the Gemini models {self.MODEL_NAMES} are available for this API key"
+            )
+        
+        GeminiService._model = genai.GenerativeModel(model_name)
+        logger.info(f"Successfully initialized {model_name} model")
+        return GeminiService._model
     
     @property
     def model(self):
@@ -104,47 +238,35 @@ class GeminiService:
         """
         return self._get_model()
 
-    def generate_questions(
+    async def _generate_batch(
         self,
         job_title: str,
-        count: int = DEFAULT_COUNT,
-        question_type: str = "mixed"
+        count: int,
+        question_type: str
     ) -> List[Dict]:
-        """Generate interview questions using Gemini AI.
+        """Generate one batch of interview questions using Gemini AI.
         
-        Uses a multi-attempt strategy with fallback to simplified prompts if needed.
+        Retries live in _attempt_question_generation, which asks only for
+        the questions still missing after each attempt.
         
         Args:
             job_title: The position title to generate questions for
-            count: Number of questions to generate (default: 5, max: 100)
+            count: Number of questions to generate (at most BATCH_SIZE)
             question_type: Type of questions - 'technical', 'behavioral', or 'mixed'
             
         Returns:
             List of question dictionaries with formatted fields
             
         Raises:
-            GeminiServiceError: If generation fails or invalid parameters
+            GeminiServiceError: If generation fails
         """
         try:
-            # Validate inputs
-            self._validate_generation_params(job_title, count, question_type)
-            
             logger.info(f"Generating {count} {question_type} questions for {job_title}")
             
-            # First attempt with standard prompt
-            questions = self._attempt_question_generation(
-                job_title, count, question_type, is_simplified=False
+            questions = await self._attempt_question_generation(
+                job_title, count, question_type
             )
             
-            # If we didn't get enough questions, try with simplified prompt
-            remaining = count - len(questions)
-            if remaining > 0:
-                logger.info(f"First attempt yielded {len(questions)}/{count} questions. Trying simplified prompt.")
-                additional_questions = self._attempt_question_generation(
-                    job_title, remaining, question_type, is_simplified=True
-                )
-                questions.extend(additional_questions)
-            
             # Return questions, limited to requested count
             if questions:
                 logger.info(f"Successfully generated {len(questions)} questions")
@@ -160,6 +282,80 @@ class GeminiService:
             logger.error(f"Error generating questions: {str(e)}")
             raise GeminiServiceError(f"Failed to generate questions: {str(e)}")
     
+    async def generate_questions(
+        self,
+        job_title: str,
+        count: int = DEFAULT_COUNT,
+        question_type: str = "mixed"
+    ) -> List[Dict]:
+        """Generate interview questions using Gemini AI.
+        
+        Calls go through the SDK's native async client, so waiting on the
+        model never blocks the event loop or a worker thread. Requests
+        larger than BATCH_SIZE are split into batches that are generated
+        concurrently, at most MAX_CONCURRENT_REQUESTS at a time, so total
+        latency is close to that of a single batch instead of one long
+        prompt. Failed batches are logged and skipped as long as at least
+        one batch succeeds. Batches can't see each other's questions, so
+        repeats are dropped when the results are merged.
+        
+        Args:
+            job_title: The position title to generate questions for
+            count: Number of questions to generate (default: 5, max: 100)
+            question_type: Type of questions - 'technical', 'behavioral', or 'mixed'
+            
+        Returns:
+            List of question dictionaries with formatted fields
+            
+        Raises:
+            GeminiServiceError: If generation fails or invalid parameters
+        """
+        self._validate_generation_params(job_title, count, question_type)
+        
+        batch_sizes = [
+            min(self.BATCH_SIZE, count - start)
+            for start in range(0, count, self.BATCH_SIZE)
+        ]
+        
+        async def generate_batch(batch_count: int) -> List[Dict]:
+            async with self._request_semaphore:
+                return await self._generate_batch(job_title, batch_count, question_type)
+        
+        results = await asyncio.gather(
+            *(generate_batch(size) for size in batch_sizes),
+            return_exceptions=True
+        )
+        
+        questions = []
+        errors = []
+        seen = set()
+        for result in results:
+            if isinstance(result, BaseException):
+                errors.append(result)
+                logger.warning(f"Question batch failed: {str(result)}")
+                continue
+            for question in result:
+                # Compare case- and whitespace-insensitively
+                text_key = " ".join(question["question_text"].lower().split())
+                if text_key not in seen:
+                    seen.add(text_key)
+                    questions.append(question)
+        
+        if len(batch_sizes) > 1:
+            logger.info(
+                f"Merged {len(batch_sizes)} batches into {len(questions)} unique questions "
+                f"({len(errors)} failed)"
+            )
+        
+        if not questions:
+            if errors and isinstance(errors[0], GeminiServiceError):
+                raise errors[0]
+            raise GeminiServiceError(
+                f"Failed to generate any valid questions for {job_title}"
+            )
+        
+        return questions[:count]
+    
     def _validate_generation_params(
         self,
         job_title: str,
@@ -179,6 +375,11 @@ class GeminiService:
         if not job_title or not isinstance(job_title, str) or not job_title.strip():
             raise GeminiServiceError("job_title must be a non-empty string")
         
+        if len(job_title) > self.MAX_JOB_TITLE_LENGTH:
+            raise GeminiServiceError(
+                f"job_title must be at most {self.MAX_JOB_TITLE_LENGTH} characters"
+            )
+        
         if not isinstance(count, int) or count < 1 or count > self.MAX_COUNT:
             raise GeminiServiceError(f"count must be between 1 and {self.MAX_COUNT}")
         
@@ -187,21 +388,21 @@ class GeminiService:
                 f"question_type must be one of {self.VALID_QUESTION_TYPES}"
             )
             
-    def _attempt_question_generation(
+    async def _attempt_question_generation(
         self,
         job_title: str,
         count: int,
         question_type: str,
-        is_simplified: bool = False,
-        max_attempts: int = None
+        max_attempts: Optional[int] = None
     ) -> List[Dict]:
-        """Make multiple attempts to generate questions with adaptive temperature.
+        """Make multiple attempts to generate questions.
+        
+        Each retry asks only for the questions still missing.
         
         Args:
             job_title: The position title
             count: Number of questions needed
             question_type: Type of questions
-            is_simplified: Whether to use simplified prompt
             max_attempts: Maximum number of generation attempts
             
         Returns:
@@ -213,27 +414,20 @@ class GeminiService:
         questions = []
         
         for attempt in range(1, max_attempts + 1):
+            remaining = count - len(questions)
             try:
-                # Build appropriate prompt
-                if is_simplified:
-                    prompt = self._build_simplified_prompt(job_title, count, question_type)
-                else:
-                    prompt = self._build_prompt(job_title, count, question_type)
-                
-                # Reduce temperature on retry for more deterministic results
-                temperature = self.RETRY_TEMPERATURE if attempt > 1 else self.DEFAULT_TEMPERATURE
+                prompt = self._build_prompt(job_title, remaining, question_type)
+                max_output_tokens = min(
+                    self.MAX_OUTPUT_TOKENS,
+                    max(self.MIN_OUTPUT_TOKENS, remaining * self.TOKENS_PER_QUESTION)
+                )
                 
-                logger.info(f"Attempt {attempt}/{max_attempts} with temperature={temperature}")
+                logger.info(f"Attempt {attempt}/{max_attempts} for {remaining} questions")
                 
                 # Generate content with proper error handling
-                response = self.model.generate_content(
+                response = await self._generate_content(
                     prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        temperature=temperature,
-                        top_p=0.95,
-                        top_k=40,
-                        max_output_tokens=4096,
-                    )
+                    _generation_config(self._temperature, max_output_tokens)
                 )
                 
                 if not response or not response.text:
@@ -248,6 +442,8 @@ class GeminiService:
                 if len(questions) >= count:
                     break
             
+            except self.PERMANENT_ERRORS as e:
+                raise GeminiServiceError(f"Gemini API rejected the request: {str(e)}")
             except Exception as e:
                 logger.warning(f"Attempt {attempt} error: {str(e)}")
                 if attempt == max_attempts:
@@ -255,24 +451,33 @@ class GeminiService:
         
         return questions
 
-    def _build_simplified_prompt(self, job_title: str, count: int, question_type: str) -> str:
-        """Build a simplified prompt for Gemini AI when standard prompt fails.
+    async def _generate_content(self, prompt: str, generation_config):
+        """Call the model, backing off exponentially on rate limit and transient errors.
         
         Args:
-            job_title: The position title
-            count: Number of questions to generate
-            question_type: Type of questions
+            prompt: Prompt to send
+            generation_config: Generation settings for the call
             
         Returns:
-            Simplified prompt string
+            Model response
+            
+        Raises:
+            google_exceptions.GoogleAPICallError: If the call still fails
+                after RETRY_LIMIT retries, or fails for another reason
         """
-        return f"""
-Generate {count} interview questions for a {job_title} position.
-Make them {question_type} questions.
-Return ONLY a valid JSON array like this:
-[{{"question": "Question text here", "type": "{question_type if question_type != 'mixed' else 'technical'}", "difficulty": 3, "tags": "relevant,tags"}}]
-"""
-        
+        for retry in range(self.RETRY_LIMIT + 1):
+            try:
+                # Resolving the model may call list_models(), a blocking request
+                model = GeminiService._model or await asyncio.to_thread(self._get_model)
+                return await model.generate_content_async(prompt, generation_config=generation_config)
+            except self.RETRYABLE_ERRORS as e:
+                if retry == self.RETRY_LIMIT:
+                    raise
+                delay = self.RETRY_BACKOFF * 2 ** retry
+                delay += random.uniform(0, delay / 4)
+                logger.warning(f"Gemini API call failed, retrying in {delay:.1f}s: {str(e)}")
+                await asyncio.sleep(delay)
+
     def _build_prompt(self, job_title: str, count: int, question_type: str) -> str:
         """Build standard prompt for Gemini AI.
         
@@ -284,41 +489,13 @@ Return ONLY a valid JSON array like this:
         Returns:
             Detailed prompt string
         """
-        if question_type == "technical":
-            focus = "technical skills, coding problems, system design, and domain-specific knowledge"
-            instruction = "Ensure questions are technically relevant to the specific role and include problems that test their expertise."
-        elif question_type == "behavioral":
-            focus = "soft skills, past experiences, teamwork, leadership, and problem-solving scenarios"
-            instruction = "Create scenario-based questions that reveal how the candidate handles real workplace situations."
-        else:
-            focus = "a mix of technical skills and behavioral aspects"
-            instruction = "Balance technical and behavioral questions to assess both skills and cultural fit."
-
-        return f"""
-You are an expert technical interviewer with deep knowledge of {job_title} roles.
-
-Task: Generate {count} high-quality, realistic interview questions for a {job_title} position.
-Focus on {focus}.
-
-{instruction}
-
-Include a range of difficulty levels (1-5 scale) where:
-- Level 1: Entry-level/basic knowledge questions
-- Level 3: Mid-level experience questions 
-- Level 5: Senior/expert level questions
-
-Format your response as a well-formed JSON array ONLY with this structure:
-[
-  {{
-    "question": "Your detailed question here...",
-    "type": "{question_type if question_type != 'mixed' else 'technical or behavioral'}",
-    "difficulty": number between 1-5,
-    "tags": "comma,separated,relevant,keywords"
-  }}
-]
-
-Do not include any explanations, markdown formatting, or additional text outside of the JSON array.
-"""
+        focus, instruction = _PROMPT_FOCUS[question_type]
+        return _PROMPT_TEMPLATE.format(
+            job_title=job_title,
+            count=count,
+            focus=focus,
+            instruction=instruction,
+        )
 
     def _parse_response(
         self,
@@ -326,9 +503,7 @@ Do not include any explanations, markdown formatting, or additional text outside
         job_title: str,
         question_type: str
     ) -> List[Dict]:
-        """Parse Gemini response and extract questions.
-        
-        Tries JSON parsing first with fallback to text parsing for robustness.
+        """Parse Gemini's JSON-mode response and extract questions.
         
         Args:
             response_text: The raw response from Gemini
@@ -336,106 +511,29 @@ Do not include any explanations, markdown formatting, or additional text outside
             question_type: Type of questions
             
         Returns:
-            List of formatted question dictionaries
+            List of formatted question dictionaries; empty if the response
+            isn't a JSON array (e.g. output cut off at max_output_tokens)
         """
         try:
-            # First try to parse as JSON
-            questions = self._try_parse_json(response_text, job_title, question_type)
-            
-            # If JSON parsing succeeded, return results
-            if questions:
-                return questions
-            
-            # Fallback to text parsing
-            logger.info("JSON parsing failed, attempting text parsing")
-            questions = self._try_parse_text(response_text, job_title, question_type)
-            return questions
-        
-        except Exception as e:
-            logger.error(f"Error parsing response: {str(e)}")
+            questions_data = orjson.loads(response_text)
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Response is not valid JSON: {str(e)}")
             return []
         
-    def _try_parse_json(
-        self,
-        response_text: str,
-        job_title: str,
-        question_type: str
-    ) -> List[Dict]:
-        """Try to parse response as JSON.
+        if not isinstance(questions_data, list):
+            logger.warning("JSON is not a list")
+            return []
         
-        Args:
-            response_text: The raw response text
-            job_title: The position title
-            question_type: Type of questions
-            
-        Returns:
-            List of question dictionaries if successful, empty list otherwise
-        """
         questions = []
+        for q in questions_data:
+            if isinstance(q, dict) and "question" in q:
+                question = self._format_question(q, job_title, question_type)
+                if question:
+                    questions.append(question)
         
-        try:
-            # Clean up response text to extract JSON
-            cleaned_text = self._extract_json_from_response(response_text)
-            
-            if not cleaned_text:
-                logger.debug("Could not extract JSON from response")
-                return []
-            
-            # Try to find and parse the JSON array
-            start_idx = cleaned_text.find('[')
-            end_idx = cleaned_text.rfind(']') + 1
-            
-            if start_idx == -1 or end_idx <= start_idx:
-                logger.debug("No JSON array found in response")
-                return []
-            
-            json_str = cleaned_text[start_idx:end_idx]
-            
-            # Attempt to parse the JSON
-            questions_data = json.loads(json_str)
-            
-            if not isinstance(questions_data, list):
-                logger.warning("JSON is not a list")
-                return []
-            
-            # Process each question
-            for q in questions_data:
-                if isinstance(q, dict) and "question" in q:
-                    question = self._format_question(q, job_title, question_type)
-                    if question:
-                        questions.append(question)
-            
-            logger.info(f"Successfully parsed {len(questions)} questions from JSON")
-        
-        except json.JSONDecodeError as e:
-            logger.debug(f"JSON parsing error: {str(e)}")
-        except Exception as e:
-            logger.debug(f"Unexpected error parsing JSON: {str(e)}")
-        
+        logger.info(f"Successfully parsed {len(questions)} questions from JSON")
         return questions
     
-    @staticmethod
-    def _extract_json_from_response(response_text: str) -> str:
-        """Extract JSON content from response with markdown cleanup.
-        
-        Args:
-            response_text: Raw response text
-            
-        Returns:
-            Cleaned text with markdown markers removed
-        """
-        cleaned = response_text.strip()
-        
-        # Remove markdown code block markers
-        markers = ["```json", "```"]
-        for marker in markers:
-            if cleaned.startswith(marker):
-                cleaned = cleaned.replace(marker, "", 1)
-            if cleaned.endswith("```"):
-                cleaned = cleaned[:cleaned.rfind("```")]
-        
-        return cleaned.strip()
-        
     def _format_question(
         self,
         question_data: Dict,
@@ -465,10 +563,11 @@ Do not include any explanations, markdown formatting, or additional text outside
             # Extract and validate difficulty
             difficulty = self._extract_difficulty(question_data)
             
-            # Extract tags
-            tags = question_data.get("tags", "").strip()
-            if not tags:
-                tags = job_title.lower().replace(" ", ",")
+            # Extract tags, falling back to the words of the job title
+            tags = (
+                self._clean_tags(question_data.get("tags") or "")
+                or self._clean_tags(job_title.lower().replace(" ", ","))
+            )
             
             return {
                 "job_title": job_title,
@@ -505,6 +604,33 @@ Do not include any explanations, markdown formatting, or additional text outside
         
         return q_type
     
+    @staticmethod
+    def _clean_tags(raw_tags: str) -> str:
+        """Make comma-separated tags pass schema validation.
+        
+        Characters other than letters, digits, underscores and dashes are
+        replaced with underscores (e.g. "CI/CD" -> "CI_CD", "node.js" ->
+        "node_js"), so only a tag that ends up empty is lost rather than the
+        whole question. Tags past the schema's length limit are dropped.
+        
+        Args:
+            raw_tags: Comma-separated tags as returned by the model
+            
+        Returns:
+            Cleaned comma-separated tags; empty if none are left
+        """
+        tags = []
+        length = -1
+        for tag in raw_tags.split(','):
+            tag = _INVALID_TAG_CHARS_RE.sub("_", tag.strip()).strip("_")
+            if not tag:
+                continue
+            length += len(tag) + 1
+            if length > _MAX_TAGS_LENGTH:
+                break
+            tags.append(tag)
+        return ','.join(tags)
+    
     @staticmethod
     def _extract_difficulty(question_data: Dict) -> int:
         """Extract and validate difficulty level.
@@ -523,228 +649,3 @@ Do not include any explanations, markdown formatting, or additional text outside
             )
         except (ValueError, TypeError):
             return GeminiService.DEFAULT_DIFFICULTY
-        
-    def _try_parse_text(
-        self,
-        response_text: str,
-        job_title: str,
-        question_type: str
-    ) -> List[Dict]:
-        """Parse response as plain text when JSON parsing fails.
-        
-        Args:
-            response_text: The raw response text
-            job_title: The position title
-            question_type: Type of questions
-            
-        Returns:
-            List of question dictionaries
-        """
-        questions = []
-        lines = response_text.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines
-            if not line:
-                continue
-            
-            # Check if line is a question
-            if not self._is_question_line(line):
-                continue
-            
-            # Clean up question format
-            question_text = self._clean_question_text(line)
-            
-            # Create question from text
-            question = self._create_text_question(question_text, job_title, question_type)
-            if question:
-                questions.append(question)
-        
-        logger.info(f"Parsed {len(questions)} questions from text")
-        return questions
-    
-    @staticmethod
-    def _is_question_line(line: str) -> bool:
-        """Check if a line appears to be a question.
-        
-        Args:
-            line: Line to check
-            
-        Returns:
-            True if line looks like a question
-        """
-        if '?' in line:
-            return True
-        
-        if line.startswith(('Q:', 'Q1:', 'Q2:', 'Q3:', 'Q4:', 'Q5:', '-')):
-            return True
-        
-        if line.startswith(('Question 1:', 'Question 2:')):
-            return True
-        
-        # Check for numbered format "1. " or "1) "
-        if line and line[0].isdigit() and len(line) > 2:
-            if line[1:3] in ('. ', ') '):
-                return True
-        
-        return False
-    
-    @staticmethod
-    def _clean_question_text(line: str) -> str:
-        """Clean up question format by removing prefixes.
-        
-        Args:
-            line: Raw line from response
-            
-        Returns:
-            Cleaned question text
-        """
-        # Remove "Q:" or "Question:" prefixes
-        if ':' in line:
-            parts = line.split(':', 1)
-            if parts[0].strip().lower().startswith(('q', 'question')):
-                return parts[1].strip()
-        
-        # Remove dash prefix
-        if line.startswith('-'):
-            return line[1:].strip()
-        
-        # Remove numbered prefix "1. " or "1) "
-        if line and line[0].isdigit() and len(line) > 2 and line[1:3] in ('. ', ') '):
-            space_idx = line.find(' ')
-            if space_idx > 0:
-                return line[space_idx + 1:].strip()
-        
-        return line
-        
-    def _create_text_question(
-        self,
-        question_text: str,
-        job_title: str,
-        question_type: str
-    ) -> Optional[Dict]:
-        """Create a question from plain text format.
-        
-        Args:
-            question_text: The extracted question text
-            job_title: The position title
-            question_type: Type of questions
-            
-        Returns:
-            Formatted question dictionary, or None if invalid
-        """
-        try:
-            if not question_text or not question_text.strip():
-                return None
-            
-            # Determine question type
-            q_type = self._infer_question_type(question_text, question_type)
-            
-            # Estimate difficulty based on content
-            difficulty = self._infer_difficulty(question_text)
-            
-            # Generate tags based on keywords
-            tags = self._generate_tags(question_text, job_title)
-            
-            return {
-                "job_title": job_title,
-                "question_text": question_text.strip(),
-                "question_type": q_type,
-                "difficulty": difficulty,
-                "tags": tags
-            }
-        
-        except Exception as e:
-            logger.debug(f"Error creating text question: {str(e)}")
-            return None
-    
-    @staticmethod
-    def _infer_question_type(question_text: str, requested_type: str) -> str:
-        """Infer question type from content if type is 'mixed'.
-        
-        Args:
-            question_text: The question text
-            requested_type: Requested question type
-            
-        Returns:
-            Inferred question type
-        """
-        if requested_type != "mixed":
-            return requested_type
-        
-        # Keywords that suggest behavioral questions
-        behavioral_keywords = {
-            'experience', 'team', 'conflict', 'leadership',
-            'challenge', 'difficult', 'situation', 'example',
-            'disagree', 'feedback', 'mistake', 'proud',
-            'improve', 'strength', 'weakness', 'worked with'
-        }
-        
-        text_lower = question_text.lower()
-        if any(keyword in text_lower for keyword in behavioral_keywords):
-            return "behavioral"
-        
-        return "technical"
-    
-    @staticmethod
-    def _infer_difficulty(question_text: str) -> int:
-        """Estimate difficulty level based on question content.
-        
-        Args:
-            question_text: The question text
-            
-        Returns:
-            Estimated difficulty level
-        """
-        text_lower = question_text.lower()
-        word_count = len(question_text.split())
-        
-        # Advanced/Senior indicators
-        if any(kw in text_lower for kw in ['senior', 'advanced', 'complex', 'architecture', 'design']):
-            return GeminiService.MAX_DIFFICULTY
-        
-        # Entry-level indicators
-        if any(kw in text_lower for kw in ['basic', 'simple', 'beginner', 'fundamental']):
-            return 2
-        
-        # Longer questions tend to be more complex
-        if word_count > 25:
-            return 4
-        
-        return GeminiService.DEFAULT_DIFFICULTY
-    
-    @staticmethod
-    def _generate_tags(question_text: str, job_title: str) -> str:
-        """Generate tags based on keywords in question and job title.
-        
-        Args:
-            question_text: The question text
-            job_title: The job title
-            
-        Returns:
-            Comma-separated tags
-        """
-        tags = job_title.lower().replace(" ", ",")
-        
-        # Keywords to extract as tags
-        keywords = {
-            'design', 'algorithm', 'data structure', 'architecture',
-            'database', 'performance', 'scalability', 'leadership',
-            'teamwork', 'communication', 'problem-solving', 'api',
-            'testing', 'deployment', 'security', 'optimization'
-        }
-        
-        text_lower = question_text.lower()
-        additional_tags = []
-        
-        for keyword in keywords:
-            if keyword in text_lower:
-                additional_tags.append(keyword.replace(" ", "_"))
-        
-        if additional_tags:
-            tags += ',' + ','.join(additional_tags)
-        
-        return tags
-
@@ -33,23 +33,6 @@ const QuestionSets: React.FC = () => {
     }
   };
 
-  // Calculate question count from the question_ids field
-  const getQuestionCount = (questionIds: string): number => {
-    try {
-      // The question_ids could be a JSON string array or a comma-separated string
-      if (questionIds.startsWith("[")) {
-        // If it's a JSON string
-        return JSON.parse(questionIds).length;
-      } else {
-        // If it's a comma-separated string
-        return questionIds.split(",").filter((id) => id.trim() !== "").length;
-      }
-    } catch (e) {
-      console.error("Error parsing question_ids:", e);
-      return 0;
-    }
-  };
-
   if (loading) {
     return (
       <div className="flex justify-center items-center h-64">
@@ -124,7 +107,7 @@ const QuestionSets: React.FC = () => {
                 name={set.name}
                 description={set.description || ""}
                 jobTitle={set.job_title}
-                questionCount={getQuestionCount(set.question_ids)}
+                questionCount={set.question_ids.length}
                 onSelect={() => console.log(`Selected set ${set.id}`)}
               />
             </motion.div>
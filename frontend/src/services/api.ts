@@ -70,10 +70,12 @@ export const questionsApi = {
 
   getAll: (params?: {
     skip?: number;
+    after_id?: number;
     limit?: number;
     job_title?: string;
     question_type?: string;
     flagged_only?: boolean;
+    tag?: string;
   }) => api.get<Question[]>('/api/questions/', { params }),
 
   getById: (id: number) =>
@@ -95,6 +97,7 @@ export const questionsApi = {
 export const questionSetsApi = {
   getAll: (params?: {
     skip?: number;
+    after_id?: number;
     limit?: number;
   }) => api.get<QuestionSet[]>('/api/questions/sets/', { params }),
 
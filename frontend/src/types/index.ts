@@ -15,7 +15,7 @@ export interface QuestionSet {
   name: string;
   description?: string;
   job_title: string;
-  question_ids: string;
+  question_ids: number[];
   created_at: string;
   updated_at?: string;
 }
@@ -41,6 +41,7 @@ export interface QuestionGenerateRequest {
   job_title: string;
   count: number;
   question_type: 'technical' | 'behavioral' | 'mixed';
+  no_cache?: boolean;
 }
 
 export interface QuestionCreateRequest {